@@ -2,8 +2,6 @@
 Activity Feed API Endpoints
 Chronological timeline of all significant events
 """
-from typing import Any
-
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -4,7 +4,7 @@ Library quality report, storage analytics, duplicates, upgrade opportunities, co
 """
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -4,19 +4,35 @@ Plex collection management
 """
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.core.database import get_db
 from app.core.logging import get_logger
 from app.integrations.plex.collection_manager import CollectionManager
 from app.models.collection_change import CollectionChange
 from app.models.movie import Movie
+from app.schemas.movie import MovieResponse
+from app.utils import library_cache
+from app.utils.http_cache import REVALIDATE, weak_etag
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+# collection_type -> (CollectionManager add method, remove method, Movie flag)
+COLLECTION_ACTIONS: dict[str, tuple[str, str, str]] = {
+    "dv": ("add_to_dv_collection", "remove_from_dv_collection", "in_dv_collection"),
+    "p7": ("add_to_p7_collection", "remove_from_p7_collection", "in_p7_collection"),
+    "atmos": (
+        "add_to_atmos_collection",
+        "remove_from_atmos_collection",
+        "in_atmos_collection",
+    ),
+}
+
 
 @router.get("/summary", response_model=dict[str, Any])
 async def get_collections_summary(db: AsyncSession = Depends(get_db)):
@@ -25,6 +41,12 @@ async def get_collections_summary(db: AsyncSession = Depends(get_db)):
 
     Returns counts of movies in each collection.
     """
+    return await library_cache.cached(
+        "collections_summary", lambda: _collections_summary(db)
+    )
+
+
+async def _collections_summary(db: AsyncSession) -> dict[str, int]:
     # DV collection count
     dv_result = await db.execute(
         select(func.count())
@@ -95,6 +117,72 @@ async def verify_collections(db: AsyncSession = Depends(get_db)):
     return stats
 
 
+@router.get("/{collection_type}/movies")
+async def get_collection_movies(
+    collection_type: str,
+    request: Request,
+    limit: int | None = Query(None, ge=1, le=500, description="Page size (all if omitted)"),
+    offset: int = Query(0, ge=0, description="Movies to skip"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    List the movies in a collection, ordered by title
+
+    Collection types: dv, p7, atmos
+
+    With limit/offset only that page is loaded and serialized; total is
+    still the size of the whole collection. Responses carry a weak ETag and
+    a matching If-None-Match gets a 304.
+    """
+    actions = COLLECTION_ACTIONS.get(collection_type)
+    if actions is None:
+        raise HTTPException(status_code=400, detail="Invalid collection type")
+    in_collection = getattr(Movie, actions[2]) == True
+
+    async def encode() -> tuple[bytes, str]:
+        result = await db.execute(
+            select(Movie)
+            .where(in_collection)
+            .order_by(Movie.title, Movie.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        movies = result.scalars().all()
+
+        if limit is None and not offset:
+            total = len(movies)
+        else:
+            total = await db.scalar(
+                select(func.count()).select_from(Movie).where(in_collection)
+            ) or 0
+
+        settings = get_settings()
+        names = {
+            "dv": settings.COLLECTION_NAME_ALL_DV,
+            "p7": settings.COLLECTION_NAME_PROFILE7,
+            "atmos": settings.COLLECTION_NAME_TRUEHD_ATMOS,
+        }
+        body = orjson.dumps({
+            "collection_name": names[collection_type],
+            "movies": [MovieResponse.model_validate(m).model_dump() for m in movies],
+            "total": total,
+        })
+        return body, weak_etag(body)
+
+    # Only first pages are cached: library_cache evicts on invalidate(), not
+    # on TTL expiry, so keying on arbitrary offsets would grow it without bound
+    if offset:
+        body, etag = await encode()
+    else:
+        body, etag = await library_cache.cached(
+            ("collection_movies", collection_type, limit), encode
+        )
+    headers = {"ETag": etag, "Cache-Control": REVALIDATE}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
 @router.post("/{collection_type}/add/{rating_key}")
 async def add_to_collection(
     collection_type: str,
@@ -106,6 +194,11 @@ async def add_to_collection(
 
     Collection types: dv, p7, atmos
     """
+    actions = COLLECTION_ACTIONS.get(collection_type)
+    if actions is None:
+        raise HTTPException(status_code=400, detail="Invalid collection type")
+    add_method, _, flag = actions
+
     # Get movie
     result = await db.execute(
         select(Movie).where(Movie.rating_key == rating_key)
@@ -118,20 +211,9 @@ async def add_to_collection(
     manager = CollectionManager()
 
     # Add to appropriate collection
-    if collection_type == "dv":
-        success = await manager.add_to_dv_collection(rating_key, movie.title)
-        if success:
-            movie.in_dv_collection = True
-    elif collection_type == "p7":
-        success = await manager.add_to_p7_collection(rating_key, movie.title)
-        if success:
-            movie.in_p7_collection = True
-    elif collection_type == "atmos":
-        success = await manager.add_to_atmos_collection(rating_key, movie.title)
-        if success:
-            movie.in_atmos_collection = True
-    else:
-        raise HTTPException(status_code=400, detail="Invalid collection type")
+    success = await getattr(manager, add_method)(rating_key, movie.title)
+    if success:
+        setattr(movie, flag, True)
 
     if not success:
         raise HTTPException(status_code=500, detail="Failed to add to collection")
@@ -150,6 +232,7 @@ async def add_to_collection(
     db.add(change)
 
     await db.commit()
+    library_cache.invalidate()
 
     return {"success": True, "message": f"Added to {collection_type} collection"}
 
@@ -165,6 +248,11 @@ async def remove_from_collection(
 
     Collection types: dv, p7, atmos
     """
+    actions = COLLECTION_ACTIONS.get(collection_type)
+    if actions is None:
+        raise HTTPException(status_code=400, detail="Invalid collection type")
+    _, remove_method, flag = actions
+
     # Get movie
     result = await db.execute(
         select(Movie).where(Movie.rating_key == rating_key)
@@ -177,20 +265,9 @@ async def remove_from_collection(
     manager = CollectionManager()
 
     # Remove from appropriate collection
-    if collection_type == "dv":
-        success = await manager.remove_from_dv_collection(rating_key, movie.title)
-        if success:
-            movie.in_dv_collection = False
-    elif collection_type == "p7":
-        success = await manager.remove_from_p7_collection(rating_key, movie.title)
-        if success:
-            movie.in_p7_collection = False
-    elif collection_type == "atmos":
-        success = await manager.remove_from_atmos_collection(rating_key, movie.title)
-        if success:
-            movie.in_atmos_collection = False
-    else:
-        raise HTTPException(status_code=400, detail="Invalid collection type")
+    success = await getattr(manager, remove_method)(rating_key, movie.title)
+    if success:
+        setattr(movie, flag, False)
 
     if not success:
         raise HTTPException(status_code=500, detail="Failed to remove from collection")
@@ -209,19 +286,21 @@ async def remove_from_collection(
     db.add(change)
 
     await db.commit()
+    library_cache.invalidate()
 
     return {"success": True, "message": f"Removed from {collection_type} collection"}
 
 
 @router.get("/changes/history", response_model=list[dict[str, Any]])
 async def get_collection_changes(
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=500, description="Max changes"),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Get recent collection change history
 
-    Returns audit trail of collection modifications.
+    Returns audit trail of collection modifications, newest first and capped
+    at 500 rows so the payload stays bounded as the table grows.
     """
     result = await db.execute(
         select(CollectionChange)
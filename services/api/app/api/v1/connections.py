@@ -2,10 +2,11 @@
 Connections API Endpoints
 External service health monitoring
 """
+import time
 from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -18,6 +19,22 @@ from app.models.connection_status import ConnectionStatus
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Live check results are reused for a short window so a dashboard polling
+# the check endpoints doesn't probe every external service on each poll.
+CHECK_CACHE_TTL_SECONDS = 30
+_check_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+# Published /status payload. Readers return the current reference without
+# touching the database; writers bump the version and drop the data, and a
+# rebuild is only published if no write happened while it was running.
+_status_snapshot: dict[str, Any] = {"version": 0, "data": None}
+
+
+def invalidate_status_snapshot() -> None:
+    """Drop the published /status payload after connection rows change"""
+    _status_snapshot["version"] += 1
+    _status_snapshot["data"] = None
+
 
 @router.get("/status", response_model=dict[str, Any])
 async def get_all_connections_status(db: AsyncSession = Depends(get_db)):
@@ -31,6 +48,11 @@ async def get_all_connections_status(db: AsyncSession = Depends(get_db)):
     - Telegram
     - IPT Scraper
     """
+    snapshot = _status_snapshot["data"]
+    if snapshot is not None:
+        return snapshot
+
+    version = _status_snapshot["version"]
     result = await db.execute(select(ConnectionStatus))
     connections = result.scalars().all()
 
@@ -49,6 +71,9 @@ async def get_all_connections_status(db: AsyncSession = Depends(get_db)):
             "version": conn.version,
         }
 
+    if _status_snapshot["version"] == version:
+        _status_snapshot["data"] = status_dict
+
     return status_dict
 
 
@@ -95,13 +120,19 @@ async def get_service_status(
 @router.post("/{service}/check", response_model=dict[str, Any])
 async def check_service_connection(
     service: str,
+    force: bool = Query(False, description="Bypass the cached result"),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Manually trigger a connection check for a service
 
-    Performs a health check and updates the connection status.
+    Performs a health check and updates the connection status. Results are
+    cached for CHECK_CACHE_TTL_SECONDS unless force is set.
     """
+    cached = _check_cache.get(service)
+    if cached and not force and time.monotonic() - cached[0] < CHECK_CACHE_TTL_SECONDS:
+        return cached[1]
+
     settings = get_settings()
     start_time = datetime.now()
 
@@ -193,6 +224,7 @@ async def check_service_connection(
 
     await db.commit()
     await db.refresh(conn)
+    invalidate_status_snapshot()
 
     logger.info(
         f"connection.checked.{service}",
@@ -200,7 +232,7 @@ async def check_service_connection(
         response_time_ms=response_time_ms,
     )
 
-    return {
+    response = {
         "service": service,
         "is_connected": is_connected,
         "status_message": status_message,
@@ -208,10 +240,16 @@ async def check_service_connection(
         "response_time_ms": response_time_ms,
         "checked_at": end_time,
     }
+    _check_cache[service] = (time.monotonic(), response)
+
+    return response
 
 
 @router.post("/check-all", response_model=dict[str, Any])
-async def check_all_connections(db: AsyncSession = Depends(get_db)):
+async def check_all_connections(
+    force: bool = Query(False, description="Bypass cached results"),
+    db: AsyncSession = Depends(get_db),
+):
     """
     Check all configured service connections
 
@@ -221,20 +259,20 @@ async def check_all_connections(db: AsyncSession = Depends(get_db)):
     results = {}
 
     # Check Plex (always required)
-    results["plex"] = await check_service_connection("plex", db)
+    results["plex"] = await check_service_connection("plex", force=force, db=db)
 
     # Check optional services if configured
     if settings.QBITTORRENT_HOST:
-        results["qbittorrent"] = await check_service_connection("qbittorrent", db)
+        results["qbittorrent"] = await check_service_connection("qbittorrent", force=force, db=db)
 
     if settings.RADARR_URL:
-        results["radarr"] = await check_service_connection("radarr", db)
+        results["radarr"] = await check_service_connection("radarr", force=force, db=db)
 
     if settings.TELEGRAM_ENABLED:
-        results["telegram"] = await check_service_connection("telegram", db)
+        results["telegram"] = await check_service_connection("telegram", force=force, db=db)
 
     # Always check IPT scraper
-    results["ipt_scraper"] = await check_service_connection("ipt_scraper", db)
+    results["ipt_scraper"] = await check_service_connection("ipt_scraper", force=force, db=db)
 
     all_connected = all(r["is_connected"] for r in results.values())
 
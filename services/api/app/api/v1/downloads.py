@@ -2,8 +2,6 @@
 Downloads API Endpoints
 Approval workflow for torrent downloads
 """
-from typing import Any
-
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
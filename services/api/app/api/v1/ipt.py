@@ -5,7 +5,8 @@ Trigger scans, view cached torrents, manage IPT integration
 from typing import Any, AsyncGenerator
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -13,54 +14,85 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import get_settings
 from app.core.database import get_db
 from app.core.logging import get_logger
-from app.services.ipt_service import IPTService
+from app.services.ipt_scraper import get_scraper
+from app.services.ipt_service import IPTService, invalidate_radarr_index
+from app.utils.http_cache import conditional_json
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Shared across download requests so Radarr/qbitcopy connections are reused
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(timeout=30.0)
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared download client on application shutdown"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 @router.get("/cache", response_model=list[dict[str, Any]])
-async def get_cached_torrents():
+async def get_cached_torrents(request: Request):
     """
     Get cached IPT torrents
 
     Returns list of known torrents from the scraper cache.
+    Sent with a weak ETag; an unchanged cache revalidates as a 304.
     """
     service = IPTService()
     try:
         torrents = await service.get_known_torrents()
         logger.info("ipt.cache_retrieved", count=len(torrents))
-        return torrents
+        return conditional_json(request, torrents)
     except Exception as e:
         logger.error("ipt.cache_retrieval_failed", error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to retrieve cache: {str(e)}")
 
 
 @router.get("/results", response_model=dict[str, Any])
-async def get_scan_results(db: AsyncSession = Depends(get_db)):
+async def get_scan_results(request: Request, db: AsyncSession = Depends(get_db)):
     """
     Get latest IPT scan results
 
     Returns the most recent scan results with all torrents found,
     enriched with library match information.
+    Sent with a weak ETag; polls between scans revalidate as a 304.
     """
     service = IPTService(db=db)
     try:
         results = await service.get_latest_results()
-        return results
+        return conditional_json(request, results)
     except Exception as e:
         logger.error("ipt.results_retrieval_failed", error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to get results: {str(e)}")
 
 
 @router.post("/scan", response_model=dict[str, Any])
-async def trigger_scan():
+async def trigger_scan(
+    background: bool = Query(False, description="Start the scan and return immediately"),
+):
     """
     Trigger IPT scan
 
     Triggers a new scan of IPTorrents and returns the results.
-    This may take 30-60 seconds to complete.
+    This may take 30-60 seconds to complete. With background=true the scan
+    is started (or left running if one already is) and the response returns
+    at once; poll /results for the outcome.
     """
+    if background:
+        started = get_scraper().start_scan()
+        logger.info("ipt.scan_started_background", started=started)
+        return {"success": True, "scanning": True, "started": started}
+
     service = IPTService()
     try:
         results = await service.trigger_scan()
@@ -72,12 +104,8 @@ async def trigger_scan():
 
 async def _stream_scan_logs() -> AsyncGenerator[bytes, None]:
     """Stream SSE events from the in-process scraper."""
-    import json as _json
-
-    from app.services.ipt_scraper import get_scraper
-
     async for event in get_scraper().scan_stream():
-        yield f"data: {_json.dumps(event)}\n\n".encode("utf-8")
+        yield b"data: " + orjson.dumps(event) + b"\n\n"
 
 
 @router.get("/scan/stream")
@@ -157,144 +185,146 @@ async def download_torrent(req: DownloadRequest):
 
     movie_path = None
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        # Step 1: Find or add movie in Radarr
-        if not req.in_radarr:
-            # Look up movie via Radarr
-            lookup_resp = await client.get(
-                f"{radarr_url}/api/v3/movie/lookup",
-                params={"term": req.title},
-                headers={"X-Api-Key": radarr_key},
-            )
-            if lookup_resp.status_code != 200:
-                raise HTTPException(status_code=502, detail="Failed to search Radarr")
-
-            candidates = lookup_resp.json()
-            # Match by year if available
-            match = None
-            for c in candidates:
-                if req.year and c.get("year") == req.year:
-                    match = c
-                    break
-            if not match and candidates:
-                match = candidates[0]
-
-            if not match:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Could not find '{req.title}' in Radarr lookup"
-                )
-
-            # Get root folder
-            root_resp = await client.get(
-                f"{radarr_url}/api/v3/rootfolder",
-                headers={"X-Api-Key": radarr_key},
-            )
-            root_folders = root_resp.json() if root_resp.status_code == 200 else []
-            root_path = root_folders[0]["path"] if root_folders else "/movies"
-
-            # Get quality profiles
-            qp_resp = await client.get(
-                f"{radarr_url}/api/v3/qualityprofile",
-                headers={"X-Api-Key": radarr_key},
-            )
-            profiles = qp_resp.json() if qp_resp.status_code == 200 else []
-            quality_profile_id = profiles[0]["id"] if profiles else 1
-
-            # Add to Radarr
-            add_payload = {
-                "title": match.get("title", req.title),
-                "year": match.get("year", req.year),
-                "tmdbId": match.get("tmdbId"),
-                "titleSlug": match.get("titleSlug"),
-                "images": match.get("images", []),
-                "qualityProfileId": quality_profile_id,
-                "rootFolderPath": root_path,
-                "monitored": True,
-                "addOptions": {"searchForMovie": False},
-            }
-
-            add_resp = await client.post(
-                f"{radarr_url}/api/v3/movie",
-                json=add_payload,
-                headers={"X-Api-Key": radarr_key},
-            )
-
-            if add_resp.status_code in (200, 201):
-                added = add_resp.json()
-                movie_path = added.get("path") or added.get("folderName")
-                logger.info("ipt.radarr_added", title=req.title, path=movie_path)
-            elif add_resp.status_code == 400:
-                # Might already exist — extract path from error or search existing
-                error_body = add_resp.json()
-                logger.warning("ipt.radarr_add_conflict", detail=str(error_body))
-                # Fall through to find existing
-            else:
-                raise HTTPException(
-                    status_code=502,
-                    detail=f"Failed to add movie to Radarr: {add_resp.status_code}"
-                )
-
-        # If we still don't have the path, find it from existing Radarr movies
-        if not movie_path:
-            movies_resp = await client.get(
-                f"{radarr_url}/api/v3/movie",
-                headers={"X-Api-Key": radarr_key},
-            )
-            if movies_resp.status_code == 200:
-                all_movies = movies_resp.json()
-                title_lower = req.title.lower().strip()
-                for m in all_movies:
-                    m_title = (m.get("title") or "").lower().strip()
-                    m_year = m.get("year")
-                    if m_title == title_lower and (not req.year or m_year == req.year):
-                        movie_path = m.get("path") or m.get("folderName")
-                        break
-                    # Also check alternate titles
-                    for alt in m.get("alternateTitles", []):
-                        if (alt.get("title") or "").lower().strip() == title_lower:
-                            movie_path = m.get("path") or m.get("folderName")
-                            break
-                    if movie_path:
-                        break
-
-        if not movie_path:
+    client = _get_client()
+    # Step 1: Find or add movie in Radarr
+    if not req.in_radarr:
+        # Look up movie via Radarr
+        lookup_resp = await client.get(
+            f"{radarr_url}/api/v3/movie/lookup",
+            params={"term": req.title},
+            headers={"X-Api-Key": radarr_key},
+        )
+        if lookup_resp.status_code != 200:
+            raise HTTPException(status_code=502, detail="Failed to search Radarr")
+
+        candidates = lookup_resp.json()
+        # Match by year if available
+        match = None
+        for c in candidates:
+            if req.year and c.get("year") == req.year:
+                match = c
+                break
+        if not match and candidates:
+            match = candidates[0]
+
+        if not match:
             raise HTTPException(
                 status_code=404,
-                detail=f"Could not determine movie path for '{req.title}'"
+                detail=f"Could not find '{req.title}' in Radarr lookup"
             )
 
-        # Step 2: Send to qbitcopy for download
-        qbitcopy_resp = await client.post(
-            f"{settings.QBITCOPY_URL}/api/download",
-            json={
-                "moviePath": movie_path,
-                "downloadUrl": req.download_url,
-            },
+        # Get root folder
+        root_resp = await client.get(
+            f"{radarr_url}/api/v3/rootfolder",
+            headers={"X-Api-Key": radarr_key},
+        )
+        root_folders = root_resp.json() if root_resp.status_code == 200 else []
+        root_path = root_folders[0]["path"] if root_folders else "/movies"
+
+        # Get quality profiles
+        qp_resp = await client.get(
+            f"{radarr_url}/api/v3/qualityprofile",
+            headers={"X-Api-Key": radarr_key},
+        )
+        profiles = qp_resp.json() if qp_resp.status_code == 200 else []
+        quality_profile_id = profiles[0]["id"] if profiles else 1
+
+        # Add to Radarr
+        add_payload = {
+            "title": match.get("title", req.title),
+            "year": match.get("year", req.year),
+            "tmdbId": match.get("tmdbId"),
+            "titleSlug": match.get("titleSlug"),
+            "images": match.get("images", []),
+            "qualityProfileId": quality_profile_id,
+            "rootFolderPath": root_path,
+            "monitored": True,
+            "addOptions": {"searchForMovie": False},
+        }
+
+        add_resp = await client.post(
+            f"{radarr_url}/api/v3/movie",
+            json=add_payload,
+            headers={"X-Api-Key": radarr_key},
         )
 
-        if qbitcopy_resp.status_code != 200:
-            error_detail = "Unknown error"
-            try:
-                error_detail = qbitcopy_resp.json().get("error", error_detail)
-            except Exception:
-                error_detail = qbitcopy_resp.text[:200]
+        if add_resp.status_code in (200, 201):
+            added = add_resp.json()
+            movie_path = added.get("path") or added.get("folderName")
+            logger.info("ipt.radarr_added", title=req.title, path=movie_path)
+            # Results should show the new movie as in Radarr straight away
+            invalidate_radarr_index()
+        elif add_resp.status_code == 400:
+            # Might already exist — extract path from error or search existing
+            error_body = add_resp.json()
+            logger.warning("ipt.radarr_add_conflict", detail=str(error_body))
+            # Fall through to find existing
+        else:
             raise HTTPException(
                 status_code=502,
-                detail=f"qbitcopy download failed: {error_detail}"
+                detail=f"Failed to add movie to Radarr: {add_resp.status_code}"
             )
 
-        result = qbitcopy_resp.json()
-        logger.info(
-            "ipt.download_sent",
-            title=req.title,
-            path=movie_path,
-            added_to_radarr=not req.in_radarr,
+    # If we still don't have the path, find it from existing Radarr movies
+    if not movie_path:
+        movies_resp = await client.get(
+            f"{radarr_url}/api/v3/movie",
+            headers={"X-Api-Key": radarr_key},
+        )
+        if movies_resp.status_code == 200:
+            all_movies = movies_resp.json()
+            title_lower = req.title.lower().strip()
+            for m in all_movies:
+                m_title = (m.get("title") or "").lower().strip()
+                m_year = m.get("year")
+                if m_title == title_lower and (not req.year or m_year == req.year):
+                    movie_path = m.get("path") or m.get("folderName")
+                    break
+                # Also check alternate titles
+                for alt in m.get("alternateTitles", []):
+                    if (alt.get("title") or "").lower().strip() == title_lower:
+                        movie_path = m.get("path") or m.get("folderName")
+                        break
+                if movie_path:
+                    break
+
+    if not movie_path:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Could not determine movie path for '{req.title}'"
         )
 
-        return {
-            "success": True,
-            "message": result.get("message", "Torrent added"),
-            "movie_path": movie_path,
-            "added_to_radarr": not req.in_radarr,
-        }
+    # Step 2: Send to qbitcopy for download
+    qbitcopy_resp = await client.post(
+        f"{settings.QBITCOPY_URL}/api/download",
+        json={
+            "moviePath": movie_path,
+            "downloadUrl": req.download_url,
+        },
+    )
+
+    if qbitcopy_resp.status_code != 200:
+        error_detail = "Unknown error"
+        try:
+            error_detail = qbitcopy_resp.json().get("error", error_detail)
+        except Exception:
+            error_detail = qbitcopy_resp.text[:200]
+        raise HTTPException(
+            status_code=502,
+            detail=f"qbitcopy download failed: {error_detail}"
+        )
+
+    result = qbitcopy_resp.json()
+    logger.info(
+        "ipt.download_sent",
+        title=req.title,
+        path=movie_path,
+        added_to_radarr=not req.in_radarr,
+    )
+
+    return {
+        "success": True,
+        "message": result.get("message", "Torrent added"),
+        "movie_path": movie_path,
+        "added_to_radarr": not req.in_radarr,
+    }
@@ -2,15 +2,21 @@
 Movies API Endpoints
 List, filter, search movies
 """
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_session_factory
 from app.core.logging import get_logger
 from app.schemas.movie import MovieFilter, MovieListResponse, MovieResponse
 from app.services.movie_service import MovieService
+from app.utils import library_cache
+from app.utils.http_cache import conditional_json
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -39,6 +45,9 @@ async def list_movies(
 
     Returns paginated list of movies with comprehensive metadata.
     Supports filtering by title, year, DV profile, FEL, Atmos, resolution, and collections.
+
+    The page is encoded straight to JSON bytes by pydantic-core, rather than
+    dumped to dicts by FastAPI and then encoded again.
     """
     # Build filter params
     filter_params = MovieFilter(
@@ -60,17 +69,18 @@ async def list_movies(
     service = MovieService(db)
     movies, total = await service.get_movies(filter_params)
 
-    return MovieListResponse(
+    body = MovieListResponse(
         total=total,
         page=page,
         page_size=page_size,
         movies=movies,
-    )
+    ).model_dump_json()
+    return Response(body, media_type="application/json")
 
 
 @router.get("/statistics", response_model=dict[str, Any])
 @router.get("/stats/summary", response_model=dict[str, Any], include_in_schema=False)
-async def get_movie_statistics(db: AsyncSession = Depends(get_db)):
+async def get_movie_statistics(request: Request, db: AsyncSession = Depends(get_db)):
     """
     Get library statistics
 
@@ -81,10 +91,52 @@ async def get_movie_statistics(db: AsyncSession = Depends(get_db)):
     - TrueHD Atmos count
     - 4K count
     - DV profile breakdown (P4, P5, P7, P8, P9)
+
+    Sent with a weak ETag; unchanged statistics revalidate as a 304.
     """
     service = MovieService(db)
-    stats = await service.get_statistics()
-    return stats
+    stats = await library_cache.cached("statistics", service.get_statistics)
+    return conditional_json(request, stats)
+
+
+@router.get("/export")
+async def export_movies(
+    format: str = Query("json", pattern="^(json|jsonl)$", description="json or jsonl"),
+):
+    """
+    Download a full library report
+
+    The report is encoded one movie at a time as rows stream out of the
+    database, rather than building the whole document in memory first.
+    "jsonl" writes one JSON object per line.
+    """
+
+    async def encode() -> AsyncIterator[bytes]:
+        # Own session: the request-scoped one is closed before streaming starts
+        session_factory = get_session_factory()
+        async with session_factory() as db:
+            records = MovieService(db).iter_export_records()
+
+            if format == "jsonl":
+                async for record in records:
+                    yield orjson.dumps(record) + b"\n"
+                return
+
+            yield b"["
+            first = True
+            async for record in records:
+                yield orjson.dumps(record) if first else b"," + orjson.dumps(record)
+                first = False
+            yield b"]"
+
+    filename = f"felscanner_library_{datetime.now():%Y%m%d_%H%M%S}.{format}"
+    media_type = "application/x-ndjson" if format == "jsonl" else "application/json"
+
+    return StreamingResponse(
+        encode(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.get("/search/query", response_model=list[MovieResponse])
@@ -2,8 +2,6 @@
 Release Groups API Endpoints
 Release group reputation, preferences, and statistics
 """
-from typing import Any
-
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
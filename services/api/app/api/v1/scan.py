@@ -3,11 +3,11 @@ Scan API Endpoints
 Trigger scans, get status, view scan history
 """
 import asyncio
-import json
 from datetime import datetime, timezone
 from typing import AsyncGenerator
 
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -20,10 +20,13 @@ from app.schemas.scan import (
     ScanTriggerRequest,
 )
 from app.services.scan_service import ScanService
+from app.utils.http_cache import weak_etag
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+_SSE_KEEPALIVE = b'data: {"type":"keepalive"}\n\n'
+
 
 @router.post("/trigger", response_model=ScanHistoryResponse)
 async def trigger_scan(
@@ -67,9 +70,11 @@ async def trigger_scan_stream():
 
         def on_progress(message: str, scanned: int, total: int, current_movie: str | None):
             """Callback that puts progress updates into the queue"""
+            # Timestamps stay datetimes; orjson formats them when the event
+            # is written to the stream
             event = {
                 "type": "log",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": datetime.now(timezone.utc),
                 "message": message,
                 "scanned": scanned,
                 "total": total,
@@ -96,7 +101,7 @@ async def trigger_scan_stream():
                     # Send completion event
                     await progress_queue.put({
                         "type": "complete",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": datetime.now(timezone.utc),
                         "message": "Scan complete!",
                         "results": {
                             "movies_scanned": result.movies_scanned,
@@ -108,13 +113,13 @@ async def trigger_scan_stream():
                 except RuntimeError as e:
                     await progress_queue.put({
                         "type": "error",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": datetime.now(timezone.utc),
                         "message": str(e),
                     })
                 except Exception as e:
                     await progress_queue.put({
                         "type": "error",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": datetime.now(timezone.utc),
                         "message": f"Scan failed: {str(e)}",
                     })
                 finally:
@@ -131,10 +136,10 @@ async def trigger_scan_stream():
                     event = await asyncio.wait_for(progress_queue.get(), timeout=120.0)
                     if event is None:
                         break
-                    yield f"data: {json.dumps(event)}\n\n".encode()
+                    yield b"data: " + orjson.dumps(event) + b"\n\n"
                 except asyncio.TimeoutError:
                     # Send keepalive
-                    yield f"data: {json.dumps({'type': 'keepalive'})}\n\n".encode()
+                    yield _SSE_KEEPALIVE
         finally:
             if not scan_task.done():
                 scan_task.cancel()
@@ -150,23 +155,65 @@ async def trigger_scan_stream():
     )
 
 
+def _status_etag(status: ScanStatusResponse) -> str:
+    # elapsed_time ticks every second while a scan runs, which would defeat
+    # the 304/long-poll exactly when the UI polls hardest. The tag covers the
+    # scan state (id, state, progress snapshot, last scan); clients derive
+    # the elapsed time from start_time.
+    return weak_etag(status.model_dump_json(exclude={"elapsed_time"}).encode())
+
+
 @router.get("/status", response_model=ScanStatusResponse)
-async def get_scan_status(db: AsyncSession = Depends(get_db)):
+async def get_scan_status(
+    request: Request,
+    response: Response,
+    wait: int = Query(
+        0, ge=0, le=25, description="Seconds to hold the request while the status is unchanged"
+    ),
+    db: AsyncSession = Depends(get_db),
+):
     """
     Get current scan status
 
     Returns information about any running scan and the most recent completed scan.
+    Responses carry an ETag. A request whose If-None-Match matches gets a 304;
+    with ?wait=N it is held for up to N seconds until the scan state changes.
+    The ETag ignores elapsed_time, so a 304 during a scan leaves it to the
+    client to count from start_time.
     """
-    from datetime import datetime, timezone
+    # Grab the change event before reading so a change in between isn't missed
+    changed = ScanService.progress.changed
+    status = await _build_scan_status(db)
+    etag = _status_etag(status)
+    if_none_match = request.headers.get("if-none-match")
+
+    if wait and if_none_match == etag:
+        # Release the pooled connection while parked
+        await db.commit()
+        try:
+            await asyncio.wait_for(changed.wait(), timeout=wait)
+        except asyncio.TimeoutError:
+            pass
+        else:
+            status = await _build_scan_status(db)
+            etag = _status_etag(status)
+
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return status
 
+
+async def _build_scan_status(db: AsyncSession) -> ScanStatusResponse:
+    """Assemble the status payload from the running scan and scan history"""
     service = ScanService(db)
 
     is_running = await service.is_scan_running()
     current_scan = await service.get_current_scan()
 
     # Get last completed scan
-    scans, _ = await service.get_scan_history(limit=1)
-    last_scan = scans[0] if scans else None
+    last_scan = await service.get_latest_scan()
 
     # Determine state
     if is_running and current_scan:
@@ -188,13 +235,15 @@ async def get_scan_status(db: AsyncSession = Depends(get_db)):
         now = datetime.now(timezone.utc)
         elapsed_time = int((now - started).total_seconds())
 
-    response = ScanStatusResponse(
+    progress = ScanService.progress.snapshot if is_running else {}
+
+    return ScanStatusResponse(
         state=state,
-        progress=0,  # TODO: Add real-time progress tracking
-        current_movie=None,  # TODO: Track current movie
-        total_movies=current_scan.movies_scanned if current_scan else 0,
-        scanned_count=current_scan.movies_scanned if current_scan else 0,
-        message=None,
+        progress=progress.get("progress", 0),
+        current_movie=progress.get("current_movie"),
+        total_movies=progress.get("total", 0),
+        scanned_count=progress.get("scanned", 0),
+        message=progress.get("message"),
         start_time=current_scan.started_at if current_scan else None,
         elapsed_time=elapsed_time,
         is_running=is_running,
@@ -203,8 +252,6 @@ async def get_scan_status(db: AsyncSession = Depends(get_db)):
         last_scan=last_scan,
     )
 
-    return response
-
 
 @router.get("/history", response_model=ScanHistoryListResponse)
 async def get_scan_history(
@@ -2,13 +2,18 @@
 Settings API Endpoints
 Application configuration management
 """
-from fastapi import APIRouter, Depends, HTTPException
+from functools import lru_cache
+from typing import Any
+
+import orjson
+from fastapi import APIRouter, Body, Depends, HTTPException, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings as get_app_settings
 from app.core.database import get_db
 from app.core.logging import get_logger
+from app.core.settings_seed import store_value
 from app.models.settings import Setting
 from app.schemas.settings import (
     BackgroundTaskSettings,
@@ -46,6 +51,52 @@ async def list_settings(
     return settings
 
 
+@router.put("", response_model=dict[str, Any])
+@router.put("/", response_model=dict[str, Any], include_in_schema=False)
+async def update_settings(
+    values: dict[str, Any] = Body(..., description="Setting key -> new value"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Update several settings at once
+
+    Every key is resolved in one query and all changes land in one commit.
+    Keys that don't exist are reported back rather than created. Values that
+    serialize to what is already stored are left alone, so re-saving a whole
+    settings form only writes (and bumps the version of) what changed, and
+    an unchanged form skips the commit entirely.
+    """
+    result = await db.execute(select(Setting).where(Setting.key.in_(values)))
+    settings = {setting.key: setting for setting in result.scalars().all()}
+
+    updated = []
+    for key, setting in settings.items():
+        value, value_text = store_value(values[key])
+        # Compare serialized bytes: dict equality would treat true and 1 alike
+        if orjson.dumps([value, value_text]) == orjson.dumps([setting.value, setting.value_text]):
+            continue
+        setting.value, setting.value_text = value, value_text
+        setting.version += 1
+        updated.append(key)
+
+    if updated:
+        await db.commit()
+
+    unknown = sorted(set(values) - settings.keys())
+    logger.info(
+        "settings.bulk_updated",
+        count=len(updated),
+        unchanged=len(settings) - len(updated),
+        unknown=unknown,
+    )
+
+    return {
+        "message": f"Updated {len(updated)} settings",
+        "updated": sorted(updated),
+        "unknown": unknown,
+    }
+
+
 @router.get("/{key}", response_model=SettingResponse)
 async def get_setting(
     key: str,
@@ -155,6 +206,39 @@ async def delete_setting(
     logger.info("setting.deleted", key=key)
 
 
+@lru_cache(maxsize=1)
+def _notification_config_json() -> bytes:
+    """Render the notification rules once; env config is fixed per process"""
+    config = get_app_settings()
+    return NotificationSettings(**config.notification_config).model_dump_json().encode()
+
+
+@lru_cache(maxsize=1)
+def _collection_config_json() -> bytes:
+    """Render the collection settings once; env config is fixed per process"""
+    config = get_app_settings()
+    return CollectionSettings(
+        collection_name_all_dv=config.COLLECTION_NAME_ALL_DV,
+        collection_name_profile7=config.COLLECTION_NAME_PROFILE7,
+        collection_name_truehd_atmos=config.COLLECTION_NAME_TRUEHD_ATMOS,
+        collection_enable_dv=config.COLLECTION_ENABLE_DV,
+        collection_enable_p7=config.COLLECTION_ENABLE_P7,
+        collection_enable_atmos=config.COLLECTION_ENABLE_ATMOS,
+    ).model_dump_json().encode()
+
+
+@lru_cache(maxsize=1)
+def _task_config_json() -> bytes:
+    """Render the background task settings once; env config is fixed per process"""
+    config = get_app_settings()
+    return BackgroundTaskSettings(
+        scan_frequency_hours=config.SCAN_FREQUENCY_HOURS,
+        monitor_interval_minutes=config.MONITOR_INTERVAL_MINUTES,
+        connection_check_interval_minutes=config.CONNECTION_CHECK_INTERVAL_MINUTES,
+        auto_start_mode=config.AUTO_START_MODE,
+    ).model_dump_json().encode()
+
+
 @router.get("/notifications/config", response_model=NotificationSettings)
 async def get_notification_settings():
     """
@@ -162,8 +246,7 @@ async def get_notification_settings():
 
     Returns all 17 notification rules from environment config.
     """
-    config = get_app_settings()
-    return NotificationSettings(**config.notification_config)
+    return Response(_notification_config_json(), media_type="application/json")
 
 
 @router.get("/collections/config", response_model=CollectionSettings)
@@ -173,16 +256,7 @@ async def get_collection_settings():
 
     Returns Plex collection settings.
     """
-    config = get_app_settings()
-
-    return CollectionSettings(
-        collection_name_all_dv=config.COLLECTION_NAME_ALL_DV,
-        collection_name_profile7=config.COLLECTION_NAME_PROFILE7,
-        collection_name_truehd_atmos=config.COLLECTION_NAME_TRUEHD_ATMOS,
-        collection_enable_dv=config.COLLECTION_ENABLE_DV,
-        collection_enable_p7=config.COLLECTION_ENABLE_P7,
-        collection_enable_atmos=config.COLLECTION_ENABLE_ATMOS,
-    )
+    return Response(_collection_config_json(), media_type="application/json")
 
 
 @router.get("/tasks/config", response_model=BackgroundTaskSettings)
@@ -192,11 +266,4 @@ async def get_background_task_settings():
 
     Returns scheduling and auto-start settings.
     """
-    config = get_app_settings()
-
-    return BackgroundTaskSettings(
-        scan_frequency_hours=config.SCAN_FREQUENCY_HOURS,
-        monitor_interval_minutes=config.MONITOR_INTERVAL_MINUTES,
-        connection_check_interval_minutes=config.CONNECTION_CHECK_INTERVAL_MINUTES,
-        auto_start_mode=config.AUTO_START_MODE,
-    )
+    return Response(_task_config_json(), media_type="application/json")
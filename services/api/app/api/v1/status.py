@@ -12,6 +12,7 @@ from app.core.database import get_db
 from app.core.logging import get_logger
 from app.services.movie_service import MovieService
 from app.services.scan_service import ScanService
+from app.utils import library_cache
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -36,13 +37,13 @@ async def get_status(db: AsyncSession = Depends(get_db)):
     is_scanning = await scan_service.is_scan_running()
     current_scan = await scan_service.get_current_scan()
 
-    # Get last scan
-    scans, _ = await scan_service.get_scan_history(limit=1)
-    last_scan = scans[0] if scans else None
+    # Get last scan (single LIMIT 1 lookup, no pagination count)
+    last_scan = await scan_service.get_latest_scan()
 
-    # Get library statistics
+    # Library statistics come from the shared snapshot the movies endpoint
+    # also serves, rebuilt only after the movies table changes
     movie_service = MovieService(db)
-    stats = await movie_service.get_statistics()
+    stats = await library_cache.cached("statistics", movie_service.get_statistics)
 
     return {
         "app": {
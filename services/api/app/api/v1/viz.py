@@ -16,6 +16,25 @@ logger = get_logger(__name__)
 
 ANTV_ENDPOINT = "https://antv-studio.alipay.com/api/gpt-vis"
 
+# Kept for the life of the process so a dashboard rendering several charts
+# reuses one warm TLS connection instead of handshaking per chart
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(timeout=20.0)
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared AntV client on application shutdown"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 class ChartRequest(BaseModel):
     """Minimal wrapper — forwarded to AntV as-is plus our source tag."""
@@ -56,10 +75,9 @@ async def generate_chart(req: ChartRequest) -> ChartResponse:
         payload.update(req.extra)
 
     try:
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            resp = await client.post(ANTV_ENDPOINT, json=payload)
-            resp.raise_for_status()
-            body = resp.json()
+        resp = await _get_client().post(ANTV_ENDPOINT, json=payload)
+        resp.raise_for_status()
+        body = resp.json()
     except httpx.HTTPError as exc:
         logger.warning("antv_chart_request_failed", error=str(exc), chart_type=req.type)
         raise HTTPException(status_code=502, detail="Chart service unavailable") from exc
@@ -174,6 +174,12 @@ class Settings(BaseSettings):
         le=120,
         description="Minutes between connection health checks"
     )
+    SCAN_PARALLELISM: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description="Worker processes for parsing Plex metadata during scans (0 = parse in threads)"
+    )
     AUTO_START_MODE: str = Field(
         default="none",
         description="Auto-start behavior: none, scan, monitor"
@@ -6,6 +6,7 @@ import logging
 import sys
 from typing import Any
 
+import orjson
 import structlog
 from structlog.types import EventDict, Processor
 
@@ -17,6 +18,11 @@ def add_app_context(logger: Any, method_name: str, event_dict: EventDict) -> Eve
     return event_dict
 
 
+def _orjson_dumps(obj: Any, default: Any = None, **_: Any) -> str:
+    """JSONRenderer serializer: orjson, decoded for the stdlib log handlers"""
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 def setup_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
     """
     Configure structlog for the application
@@ -39,8 +45,11 @@ def setup_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
-    # Shared processors for all configurations
+    # Shared processors for all configurations. Level filtering comes first
+    # so disabled calls (per-movie debug events during a scan) are dropped
+    # before any timestamping or rendering work is done for them.
     shared_processors: list[Processor] = [
+        structlog.stdlib.filter_by_level,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         add_app_context,
@@ -54,7 +63,7 @@ def setup_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
     if json_logs:
         # Production: JSON output
         processors = shared_processors + [
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps)
         ]
     else:
         # Development: Console-friendly output
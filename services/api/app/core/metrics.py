@@ -6,7 +6,6 @@ Exposes custom application metrics for monitoring via Prometheus/Grafana.
 
 from prometheus_client import Counter, Gauge, Histogram, generate_latest, CONTENT_TYPE_LATEST
 from fastapi import Response
-from typing import Callable
 import time
 
 
@@ -75,7 +75,7 @@ def _defaults_from_env(s: Settings) -> list[tuple[str, Any, str, str]]:
     ]
 
 
-def _store_value(value: Any) -> tuple[dict[str, Any] | None, str | None]:
+def store_value(value: Any) -> tuple[dict[str, Any] | None, str | None]:
     """
     Normalize a Python value into the Setting row's `value` (JSONB) field.
     """
@@ -102,7 +102,7 @@ async def seed_settings_if_empty(db: AsyncSession, s: Settings) -> int:
     rows = _defaults_from_env(s)
     inserted = 0
     for key, value, category, description in rows:
-        json_val, text_val = _store_value(value)
+        json_val, text_val = store_value(value)
         db.add(
             Setting(
                 key=key,
@@ -5,9 +5,10 @@ Async wrapper around plexapi for core Plex operations
 import asyncio
 from typing import Any
 
-from plexapi.myplex import MyPlexAccount
+import requests
 from plexapi.server import PlexServer
 from plexapi.video import Movie as PlexMovie
+from requests.adapters import HTTPAdapter
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
@@ -28,6 +29,41 @@ class PlexClient:
         self.settings = get_settings()
         self._server: PlexServer | None = None
         self._library = None
+        # Collections resolved by name, so per-movie add/remove calls during
+        # a scan don't re-list every collection in the library each time
+        self._collections: dict[str, Any] = {}
+
+    # Per-process snapshot of the movie list, keyed by the section's
+    # contentChangedAt and totalSize. The listing only supplies rating keys to
+    # the scanner; titles and years are read from each movie's metadata XML,
+    # so a rename or re-match shows up even when the listing is reused.
+    _library_snapshot: dict[str, Any] = {"key": None, "items": None}
+
+    # One pooled HTTP session for every PlexServer this process creates, so
+    # repeated connects (health checks, scans, manual edits) reuse keep-alive
+    # connections instead of opening fresh ones per client.
+    _http_session: requests.Session | None = None
+
+    # The PlexServer built by the last successful connect, keyed by
+    # (url, token). Building one fetches and parses the server's root
+    # descriptor, so reconnects (health checks, back-to-back scans) reuse it
+    # and only re-resolve the library section.
+    _shared_server: tuple[tuple[str, str], PlexServer] | None = None
+
+    @classmethod
+    def _get_http_session(cls) -> requests.Session:
+        if cls._http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            cls._http_session = session
+        return cls._http_session
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether connect() has resolved the configured library"""
+        return self._library is not None
 
     async def connect(self) -> bool:
         """
@@ -38,20 +74,24 @@ class PlexClient:
         """
         try:
             # Run sync plexapi calls in executor
-            loop = asyncio.get_event_loop()
-            self._server = await loop.run_in_executor(
-                None,
-                lambda: PlexServer(
-                    self.settings.PLEX_URL,
-                    self.settings.PLEX_TOKEN,
-                    timeout=self.settings.PLEX_TIMEOUT,
-                ),
-            )
+            loop = asyncio.get_running_loop()
+            key = (self.settings.PLEX_URL, self.settings.PLEX_TOKEN)
+            shared = type(self)._shared_server
+            if shared is not None and shared[0] == key:
+                self._server = shared[1]
+            else:
+                self._server = await loop.run_in_executor(
+                    None,
+                    lambda: PlexServer(
+                        *key,
+                        session=self._get_http_session(),
+                        timeout=self.settings.PLEX_TIMEOUT,
+                    ),
+                )
 
             # Get library
-            self._library = await loop.run_in_executor(
-                None, self._server.library.section, self.settings.LIBRARY_NAME
-            )
+            self._library = await loop.run_in_executor(None, self._load_library)
+            type(self)._shared_server = (key, self._server)
 
             logger.info(
                 "plex.connected",
@@ -62,9 +102,63 @@ class PlexClient:
             return True
 
         except Exception as e:
+            type(self)._shared_server = None
             logger.error("plex.connection_failed", error=str(e))
             return False
 
+    async def ping(self) -> bool:
+        """
+        Check that the Plex server is reachable
+
+        Once this process has connected, liveness is confirmed with Plex's
+        small unauthenticated /identity endpoint over the pooled session
+        rather than re-resolving the library. The first call, or any failed
+        probe, falls back to a full connect().
+
+        Returns:
+            bool: True if the server is reachable
+        """
+        shared = type(self)._shared_server
+        if shared is not None and shared[0] == (self.settings.PLEX_URL, self.settings.PLEX_TOKEN):
+            url = f"{self.settings.PLEX_URL.rstrip('/')}/identity"
+            try:
+                loop = asyncio.get_running_loop()
+                response = await loop.run_in_executor(
+                    None,
+                    lambda: self._get_http_session().get(url, timeout=self.settings.PLEX_TIMEOUT),
+                )
+                if response.status_code == 200:
+                    return True
+            except requests.RequestException as e:
+                logger.warning("plex.identity_probe_failed", error=str(e))
+
+        return await self.connect()
+
+    def _load_library(self):
+        """
+        Re-list the library sections and return the configured one
+
+        Library.section() answers from the sections loaded earlier, so on a
+        reused server the list is refetched first: the small request proves
+        the server is still reachable and yields fresh section objects (and
+        with them a fresh totalSize).
+        """
+        library = self._server.library
+        library.sections()
+        return library.section(self.settings.LIBRARY_NAME)
+
+    def _snapshot_key(self) -> tuple[Any, int] | None:
+        """
+        Key identifying the section's current contents, or None if unknown
+
+        Servers that don't report contentChangedAt never reuse a listing.
+        totalSize costs one zero-size container request.
+        """
+        changed_at = getattr(self._library, "contentChangedAt", None)
+        if changed_at is None:
+            return None
+        return changed_at, self._library.totalSize
+
     async def get_all_movies(self, chunk_size: int = 500) -> list[PlexMovie]:
         """
         Get all movies from the library using chunked fetching.
@@ -86,7 +180,17 @@ class PlexClient:
                     "Check PLEX_URL, PLEX_TOKEN and LIBRARY_NAME."
                 )
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
+        key = await loop.run_in_executor(None, self._snapshot_key)
+        snapshot = type(self)._library_snapshot
+        if key is not None and snapshot["key"] == key:
+            logger.info(
+                "plex.movies_snapshot_reused",
+                count=len(snapshot["items"]),
+                content_changed_at=key[0],
+            )
+            return list(snapshot["items"])
+
         movies = []
         offset = 0
 
@@ -102,8 +206,10 @@ class PlexClient:
                 break
             offset += chunk_size
 
+        type(self)._library_snapshot = {"key": key, "items": movies}
+
         logger.info("plex.movies_fetched", count=len(movies))
-        return movies
+        return list(movies)
 
     async def get_movie_by_rating_key(self, rating_key: str) -> PlexMovie | None:
         """
@@ -119,7 +225,7 @@ class PlexClient:
             await self.connect()
 
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             movie = await loop.run_in_executor(
                 None, self._server.fetchItem, int(rating_key)
             )
@@ -142,7 +248,7 @@ class PlexClient:
         if not self._library:
             await self.connect()
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         if year:
             results = await loop.run_in_executor(
@@ -166,16 +272,22 @@ class PlexClient:
         Returns:
             Collection object or None
         """
+        if collection_name in self._collections:
+            return self._collections[collection_name]
+
         if not self._library:
             await self.connect()
 
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             collections = await loop.run_in_executor(None, self._library.collections)
 
+            # One listing resolves every collection name
             for collection in collections:
-                if collection.title == collection_name:
-                    return collection
+                self._collections.setdefault(collection.title, collection)
+
+            if collection_name in self._collections:
+                return self._collections[collection_name]
 
             logger.debug("plex.collection_not_found", name=collection_name)
             return None
@@ -197,11 +309,13 @@ class PlexClient:
         if not self._library:
             await self.connect()
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         collection = await loop.run_in_executor(
             None, self._library.createCollection, collection_name, []
         )
 
+        self._collections[collection_name] = collection
+
         logger.info("plex.collection_created", name=collection_name)
         return collection
 
@@ -248,7 +362,7 @@ class PlexClient:
                 logger.warning("plex.movie_not_found_for_collection", rating_key=rating_key)
                 return False
 
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             await loop.run_in_executor(None, collection.addItems, [movie])
 
             logger.info(
@@ -298,7 +412,7 @@ class PlexClient:
             if not movie:
                 return False
 
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             await loop.run_in_executor(None, collection.removeItems, [movie])
 
             logger.info(
@@ -346,7 +460,7 @@ class PlexClient:
             if not self._library:
                 await self.connect()
 
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             await loop.run_in_executor(None, self._library.update)
 
             logger.info("plex.library_refresh_triggered")
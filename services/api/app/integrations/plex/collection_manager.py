@@ -2,6 +2,7 @@
 Plex Collection Manager
 Manages Plex collections for DV, P7 FEL, and Atmos movies
 """
+import asyncio
 from typing import Any
 
 from app.core.config import get_settings
@@ -21,10 +22,27 @@ class CollectionManager:
     - TrueHD Atmos
     """
 
-    def __init__(self):
-        """Initialize collection manager"""
+    def __init__(self, client: PlexClient | None = None):
+        """
+        Initialize collection manager
+
+        Args:
+            client: Plex client to share (e.g. the scanner's, already
+                    connected); a new one is created if omitted
+        """
         self.settings = get_settings()
-        self.client = PlexClient()
+        self.client = client or PlexClient()
+        # Settings are fixed for the life of the process, so resolve which
+        # collections are enabled once instead of on every per-movie check
+        self.enabled_collections = frozenset(
+            key
+            for key, enabled in (
+                ("dv", self.settings.COLLECTION_ENABLE_DV),
+                ("p7", self.settings.COLLECTION_ENABLE_P7),
+                ("atmos", self.settings.COLLECTION_ENABLE_ATMOS),
+            )
+            if enabled
+        )
 
     async def add_to_dv_collection(self, rating_key: str, movie_title: str) -> bool:
         """
@@ -163,23 +181,27 @@ class CollectionManager:
             "in_atmos_collection": False,
         }
 
+        # result key -> pending add; the collections are independent, so
+        # their Plex round trips run concurrently
+        updates = {}
+
         # Add to DV collection if has any DV profile
-        if dv_profile and self.settings.COLLECTION_ENABLE_DV:
-            results["in_dv_collection"] = await self.add_to_dv_collection(
-                rating_key, title
-            )
+        if dv_profile and "dv" in self.enabled_collections:
+            updates["in_dv_collection"] = self.add_to_dv_collection(rating_key, title)
 
         # Add to P7 collection if has FEL
-        if dv_fel and self.settings.COLLECTION_ENABLE_P7:
-            results["in_p7_collection"] = await self.add_to_p7_collection(
-                rating_key, title
-            )
+        if dv_fel and "p7" in self.enabled_collections:
+            updates["in_p7_collection"] = self.add_to_p7_collection(rating_key, title)
 
         # Add to Atmos collection if has Atmos
-        if has_atmos and self.settings.COLLECTION_ENABLE_ATMOS:
-            results["in_atmos_collection"] = await self.add_to_atmos_collection(
-                rating_key, title
-            )
+        if has_atmos and "atmos" in self.enabled_collections:
+            updates["in_atmos_collection"] = self.add_to_atmos_collection(rating_key, title)
+
+        if len(updates) > 1 and not self.client.is_connected:
+            # Connect once up front rather than once per concurrent add
+            await self.client.connect()
+
+        results.update(zip(updates, await asyncio.gather(*updates.values())))
 
         return results
 
@@ -221,6 +243,8 @@ class CollectionManager:
         total = len(movies)
         processed = 0
         last_emit = 0
+        primed = False
+        enabled = self.enabled_collections
 
         for movie in movies:
             rating_key = movie["rating_key"]
@@ -232,32 +256,47 @@ class CollectionManager:
             in_p7 = movie.get("in_p7_collection", False)
             in_atmos = movie.get("in_atmos_collection", False)
 
+            # stats key -> pending add/remove; the three collections are
+            # independent, so their Plex round trips run concurrently
+            updates = {}
+
             # DV collection logic
             should_be_in_dv = dv_profile is not None
-            if should_be_in_dv and not in_dv:
-                if await self.add_to_dv_collection(rating_key, title):
-                    stats["dv_added"] += 1
-            elif not should_be_in_dv and in_dv:
-                if await self.remove_from_dv_collection(rating_key, title):
-                    stats["dv_removed"] += 1
+            if "dv" in enabled and should_be_in_dv != bool(in_dv):
+                if should_be_in_dv:
+                    updates["dv_added"] = self.add_to_dv_collection(rating_key, title)
+                else:
+                    updates["dv_removed"] = self.remove_from_dv_collection(rating_key, title)
 
             # P7 collection logic
-            should_be_in_p7 = dv_fel
-            if should_be_in_p7 and not in_p7:
-                if await self.add_to_p7_collection(rating_key, title):
-                    stats["p7_added"] += 1
-            elif not should_be_in_p7 and in_p7:
-                if await self.remove_from_p7_collection(rating_key, title):
-                    stats["p7_removed"] += 1
+            should_be_in_p7 = bool(dv_fel)
+            if "p7" in enabled and should_be_in_p7 != bool(in_p7):
+                if should_be_in_p7:
+                    updates["p7_added"] = self.add_to_p7_collection(rating_key, title)
+                else:
+                    updates["p7_removed"] = self.remove_from_p7_collection(rating_key, title)
 
             # Atmos collection logic
-            should_be_in_atmos = has_atmos
-            if should_be_in_atmos and not in_atmos:
-                if await self.add_to_atmos_collection(rating_key, title):
-                    stats["atmos_added"] += 1
-            elif not should_be_in_atmos and in_atmos:
-                if await self.remove_from_atmos_collection(rating_key, title):
-                    stats["atmos_removed"] += 1
+            should_be_in_atmos = bool(has_atmos)
+            if "atmos" in enabled and should_be_in_atmos != bool(in_atmos):
+                if should_be_in_atmos:
+                    updates["atmos_added"] = self.add_to_atmos_collection(rating_key, title)
+                else:
+                    updates["atmos_removed"] = self.remove_from_atmos_collection(
+                        rating_key, title
+                    )
+
+            if updates:
+                if not primed:
+                    # Connect and list collections once before the first
+                    # concurrent batch so its updates don't each do it
+                    await self.client.get_collection(self.settings.COLLECTION_NAME_ALL_DV)
+                    primed = True
+
+                results = await asyncio.gather(*updates.values())
+                for key, success in zip(updates, results):
+                    if success:
+                        stats[key] += 1
 
             processed += 1
             # Emit a log line every 50 movies so the UI never goes dark during
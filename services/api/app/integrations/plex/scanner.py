@@ -3,7 +3,9 @@ Plex Scanner - Dolby Vision Profile Detection
 Core scanning logic for analyzing Plex movies and detecting DV profiles
 """
 import asyncio
+import multiprocessing
 import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 import aiohttp
@@ -42,24 +44,64 @@ class PlexScanner:
     # FEL (Full Enhancement Layer) indicator
     FEL_PATTERN = re.compile(r"BL\+EL|FEL|dvhe\.07", re.IGNORECASE)
 
+    # Per-process aiohttp session shared by every scanner instance so
+    # successive scans reuse keep-alive connections and the DNS cache
+    # instead of building a fresh connection pool each time.
+    _shared_session: aiohttp.ClientSession | None = None
+
+    # Optional per-process pool for parsing metadata XML (SCAN_PARALLELISM > 0).
+    # Metadata documents are a few KB, so by default they are parsed in the
+    # default thread executor, off the event loop; a process pool only pays
+    # for its pickling round-trip on very large libraries or slow cores.
+    _parse_pool: ProcessPoolExecutor | None = None
+
     def __init__(self):
         """Initialize scanner with Plex client"""
         self.settings = get_settings()
         self.client = PlexClient()
-        self._session: aiohttp.ClientSession | None = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session"""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.settings.PLEX_TIMEOUT)
+        """Get or create the shared aiohttp session"""
+        cls = type(self)
+        if cls._shared_session is None or cls._shared_session.closed:
+            cls._shared_session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.settings.PLEX_TIMEOUT),
+                connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300),
+            )
+        return cls._shared_session
+
+    def _get_parse_pool(self) -> ProcessPoolExecutor | None:
+        """Get or create the shared XML parsing pool; None means the default thread executor"""
+        if not self.settings.SCAN_PARALLELISM:
+            return None
+        cls = type(self)
+        if cls._parse_pool is None:
+            # spawn rather than fork: this process runs threads (executor,
+            # DB driver) that a forked child could inherit mid-lock
+            cls._parse_pool = ProcessPoolExecutor(
+                max_workers=self.settings.SCAN_PARALLELISM,
+                mp_context=multiprocessing.get_context("spawn"),
             )
-        return self._session
+        return cls._parse_pool
 
     async def close(self):
-        """Close aiohttp session"""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """
+        Release per-scan resources (intentionally a no-op)
+
+        Kept so callers can close a scanner without knowing what it shares.
+        The HTTP session and parsing pool outlive the scan; they are
+        released by close_shared_session() on application shutdown.
+        """
+
+    @classmethod
+    async def close_shared_session(cls):
+        """Close the shared aiohttp session and XML parsing pool"""
+        if cls._shared_session and not cls._shared_session.closed:
+            await cls._shared_session.close()
+        cls._shared_session = None
+        if cls._parse_pool is not None:
+            cls._parse_pool.shutdown(wait=False, cancel_futures=True)
+            cls._parse_pool = None
 
     async def fetch_movie_xml(self, rating_key: str) -> dict[str, Any] | None:
         """
@@ -79,8 +121,10 @@ class PlexScanner:
             async with session.get(url, params=params) as response:
                 if response.status == 200:
                     xml_text = await response.text()
-                    parsed = xmltodict.parse(xml_text)
-                    return parsed
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(
+                        self._get_parse_pool(), xmltodict.parse, xml_text
+                    )
                 else:
                     logger.warning(
                         "plex.xml_fetch_failed",
@@ -254,6 +298,19 @@ class PlexScanner:
                 logger.warning("scanner.no_video_element", rating_key=rating_key)
                 return movie_data
 
+            # The listing object may come from a reused library snapshot; the
+            # XML is fetched fresh, so renames and re-matches are taken from it
+            for field, attr in (
+                ("title", "@title"),
+                ("sort_title", "@titleSort"),
+                ("original_title", "@originalTitle"),
+            ):
+                if video_element.get(attr):
+                    movie_data[field] = video_element[attr]
+            year = video_element.get("@year")
+            if year and year.isdigit():
+                movie_data["year"] = int(year)
+
             # Handle multiple versions
             media_elements = video_element.get("Media", [])
             if isinstance(media_elements, dict):
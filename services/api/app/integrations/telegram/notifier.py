@@ -2,10 +2,12 @@
 Telegram Notifier
 Formats and sends notifications via Telegram
 """
+import asyncio
+import re
+from collections.abc import Sequence
 from datetime import datetime, timedelta
-from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
@@ -15,6 +17,69 @@ from app.models.notification_queue import NotificationQueue
 
 logger = get_logger(__name__)
 
+# Telegram rejects messages longer than this
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+MESSAGE_SEPARATOR = "\n\n"
+# Room left in each split part for the "(continued i/n)" marker
+CONTINUATION_RESERVE = 40
+# Pending rows fetched per round while draining the queue
+NOTIFICATION_BATCH_SIZE = 10
+# Opening or closing HTML tag, as used by Telegram's HTML parse mode
+_TAG_RE = re.compile(r"<(/?)([a-zA-Z][\w-]*)[^>]*>")
+
+# Message templates, parsed once at import and filled with str.format_map
+APPROVAL_TEMPLATE = (
+    "<b>🎬 New Download Available</b>\n\n"
+    "<b>Movie:</b> {movie_title}{year_str}\n"
+    "<b>Quality:</b> {quality}\n"
+    "{details}"
+    "\n<code>{torrent_name}</code>\n"
+    "\n<i>Expires in {expire_hours} hours</i>"
+)
+SCAN_COMPLETE_TEMPLATE = (
+    "<b>✅ Library Scan Complete</b>\n\n"
+    "<b>Movies Scanned:</b> {movies_scanned}\n"
+    "<b>Dolby Vision:</b> {dv_discovered}\n"
+    "<b>DV FEL (P7):</b> {fel_discovered}\n"
+    "<b>TrueHD Atmos:</b> {atmos_discovered}\n"
+    "<b>Duration:</b> {duration_seconds:.1f}s\n"
+)
+UPGRADE_FOUND_TEMPLATE = (
+    "<b>⬆️ Upgrade Available</b>\n\n"
+    "<b>Movie:</b> {movie_title}\n"
+    "<b>Current:</b> {current_quality}\n"
+    "<b>New:</b> {new_quality}\n"
+    "<b>Type:</b> {upgrade_type}\n"
+)
+
+# Set whenever a notification is queued so the scheduler's worker can send it
+# right away instead of waiting for the next polling interval.
+_queue_signal = asyncio.Event()
+
+
+def signal_pending_notifications() -> None:
+    """Wake the notification worker after queueing a message"""
+    _queue_signal.set()
+
+
+async def wait_for_pending_notifications(timeout: float) -> bool:
+    """
+    Block until a notification is queued or the timeout elapses
+
+    Args:
+        timeout: Maximum seconds to wait
+
+    Returns:
+        bool: True if woken by a newly queued notification
+    """
+    try:
+        await asyncio.wait_for(_queue_signal.wait(), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        _queue_signal.clear()
+
 
 class TelegramNotifier:
     """
@@ -23,11 +88,18 @@ class TelegramNotifier:
     Formats messages and manages notification queue.
     """
 
-    def __init__(self, db: AsyncSession):
-        """Initialize notifier"""
+    def __init__(self, db: AsyncSession, handler: TelegramHandler | None = None):
+        """
+        Initialize notifier
+
+        Args:
+            db: Database session
+            handler: Shared handler to send through; a new one is
+                created (and initialized on first send) if omitted
+        """
         self.db = db
         self.settings = get_settings()
-        self.handler = TelegramHandler()
+        self.handler = handler or TelegramHandler()
 
     def format_approval_message(
         self,
@@ -54,25 +126,22 @@ class TelegramNotifier:
         Returns:
             str: Formatted HTML message
         """
-        year_str = f" ({movie_year})" if movie_year else ""
-
-        message = f"<b>🎬 New Download Available</b>\n\n"
-        message += f"<b>Movie:</b> {movie_title}{year_str}\n"
-        message += f"<b>Quality:</b> {quality}\n"
-
+        details = []
         if upgrade_type:
-            message += f"<b>Upgrade:</b> {upgrade_type}\n"
-
+            details.append(f"<b>Upgrade:</b> {upgrade_type}\n")
         if size_mb:
-            message += f"<b>Size:</b> {size_mb:.1f} MB\n"
-
+            details.append(f"<b>Size:</b> {size_mb:.1f} MB\n")
         if seeders:
-            message += f"<b>Seeders:</b> {seeders}\n"
-
-        message += f"\n<code>{torrent_name}</code>\n"
-        message += f"\n<i>Expires in {self.settings.NOTIFY_EXPIRE_HOURS} hours</i>"
+            details.append(f"<b>Seeders:</b> {seeders}\n")
 
-        return message
+        return APPROVAL_TEMPLATE.format_map({
+            "movie_title": movie_title,
+            "year_str": f" ({movie_year})" if movie_year else "",
+            "quality": quality,
+            "details": "".join(details),
+            "torrent_name": torrent_name,
+            "expire_hours": self.settings.NOTIFY_EXPIRE_HOURS,
+        })
 
     def format_scan_complete_message(
         self,
@@ -95,14 +164,13 @@ class TelegramNotifier:
         Returns:
             str: Formatted message
         """
-        message = "<b>✅ Library Scan Complete</b>\n\n"
-        message += f"<b>Movies Scanned:</b> {movies_scanned}\n"
-        message += f"<b>Dolby Vision:</b> {dv_discovered}\n"
-        message += f"<b>DV FEL (P7):</b> {fel_discovered}\n"
-        message += f"<b>TrueHD Atmos:</b> {atmos_discovered}\n"
-        message += f"<b>Duration:</b> {duration_seconds:.1f}s\n"
-
-        return message
+        return SCAN_COMPLETE_TEMPLATE.format_map({
+            "movies_scanned": movies_scanned,
+            "dv_discovered": dv_discovered,
+            "fel_discovered": fel_discovered,
+            "atmos_discovered": atmos_discovered,
+            "duration_seconds": duration_seconds,
+        })
 
     def format_upgrade_found_message(
         self,
@@ -112,13 +180,12 @@ class TelegramNotifier:
         upgrade_type: str,
     ) -> str:
         """Format upgrade discovery notification"""
-        message = "<b>⬆️ Upgrade Available</b>\n\n"
-        message += f"<b>Movie:</b> {movie_title}\n"
-        message += f"<b>Current:</b> {current_quality}\n"
-        message += f"<b>New:</b> {new_quality}\n"
-        message += f"<b>Type:</b> {upgrade_type}\n"
-
-        return message
+        return UPGRADE_FOUND_TEMPLATE.format_map({
+            "movie_title": movie_title,
+            "current_quality": current_quality,
+            "new_quality": new_quality,
+            "upgrade_type": upgrade_type,
+        })
 
     async def queue_approval_notification(
         self,
@@ -159,6 +226,7 @@ class TelegramNotifier:
         await self.db.refresh(notification)
 
         logger.info("notification.queued", id=notification.id, type="download_approval")
+        signal_pending_notifications()
 
         return notification
 
@@ -172,6 +240,9 @@ class TelegramNotifier:
         """
         Queue a simple notification
 
+        Messages longer than Telegram allows are split on line boundaries
+        into several queued parts, so nothing is truncated or rejected.
+
         Args:
             notification_type: Type of notification
             message: Message text
@@ -179,88 +250,314 @@ class TelegramNotifier:
             delay_seconds: Delay before sending
 
         Returns:
-            NotificationQueue: Queued notification
+            NotificationQueue: Queued notification (the first part if split)
         """
         scheduled_at = datetime.now() + timedelta(seconds=delay_seconds)
 
-        notification = NotificationQueue(
-            notification_type=notification_type,
-            priority=priority,
-            message=message,
-            parse_mode="HTML",
-            scheduled_at=scheduled_at,
-        )
-
-        self.db.add(notification)
+        notifications = [
+            NotificationQueue(
+                notification_type=notification_type,
+                priority=priority,
+                message=part,
+                parse_mode="HTML",
+                scheduled_at=scheduled_at,
+            )
+            for part in _split_message(message)
+        ]
+
+        self.db.add_all(notifications)
         await self.db.commit()
-        await self.db.refresh(notification)
 
-        logger.info("notification.queued", id=notification.id, type=notification_type)
+        for notification in notifications:
+            logger.info("notification.queued", id=notification.id, type=notification_type)
+        # Delayed messages signal too, so the worker can re-time its wait
+        signal_pending_notifications()
 
-        return notification
+        return notifications[0]
 
     async def process_pending_notifications(self) -> int:
         """
         Process all pending notifications in queue
 
+        Approval requests are sent one by one since each carries its own
+        inline keyboard. Simple notifications of the same type are joined
+        into as few Telegram messages as the size limit allows.
+
+        Rows are fetched in batches until none are due, so a burst larger
+        than one batch is drained in a single wake-up instead of one batch
+        per worker timeout. A group's last, partly filled message is held
+        back and topped up from the following batches, so a burst of one
+        type goes out as few messages regardless of the fetch size.
+
         Returns:
             int: Number of notifications sent
         """
         if not self.settings.TELEGRAM_ENABLED:
             return 0
 
-        # Get pending notifications
-        result = await self.db.execute(
-            select(NotificationQueue)
+        sent_count = 0
+        held: dict[tuple[str, str, bool], list[NotificationQueue]] = {}
+        while True:
+            # Every processed row leaves "pending" (sent or failed) or is
+            # held back and excluded, so each round makes progress
+            query = (
+                select(NotificationQueue)
+                .where(NotificationQueue.status == "pending")
+                .where(NotificationQueue.scheduled_at <= datetime.now())
+            )
+            held_ids = [n.id for group in held.values() for n in group]
+            if held_ids:
+                query = query.where(NotificationQueue.id.not_in(held_ids))
+            result = await self.db.execute(
+                # Parts of a split message share created_at; id keeps them in order
+                query.order_by(
+                    NotificationQueue.priority.asc(),
+                    NotificationQueue.created_at.asc(),
+                    NotificationQueue.id.asc(),
+                )
+                .limit(NOTIFICATION_BATCH_SIZE)
+            )
+            notifications = result.scalars().all()
+            drained = len(notifications) < NOTIFICATION_BATCH_SIZE
+
+            if notifications or held:
+                sent_count += await self._process_batch(notifications, held, flush=drained)
+            if drained:
+                return sent_count
+
+    async def seconds_until_next_due(self) -> float | None:
+        """
+        Seconds until the earliest pending notification falls due
+
+        Returns:
+            float | None: 0.0 if one is already due, None if nothing is
+                pending or Telegram is disabled
+        """
+        if not self.settings.TELEGRAM_ENABLED:
+            return None
+
+        next_at = await self.db.scalar(
+            select(func.min(NotificationQueue.scheduled_at))
             .where(NotificationQueue.status == "pending")
-            .where(NotificationQueue.scheduled_at <= datetime.now())
-            .order_by(NotificationQueue.priority.asc(), NotificationQueue.created_at.asc())
-            .limit(10)  # Process in batches
         )
-        notifications = result.scalars().all()
+        if next_at is None:
+            return None
+        return max((next_at - datetime.now(next_at.tzinfo)).total_seconds(), 0.0)
+
+    async def _process_batch(
+        self,
+        notifications: Sequence[NotificationQueue],
+        held: dict[tuple[str, str, bool], list[NotificationQueue]],
+        flush: bool,
+    ) -> int:
+        """
+        Send one fetched batch of pending notifications
+
+        Args:
+            notifications: Rows fetched this round
+            held: Simple notifications not yet sent, grouped by type; updated
+                in place with each group's partly filled last message
+            flush: Send the held messages too (the queue is drained)
+
+        Returns:
+            int: Number of notifications sent
+        """
+        # Initialize handler if needed
+        if not self.handler._application:
+            await self.handler.initialize()
 
         sent_count = 0
 
         for notification in notifications:
-            try:
-                # Initialize handler if needed
-                if not self.handler._application:
-                    await self.handler.initialize()
-
-                # Send notification
-                if notification.reply_markup:
-                    # Approval request with buttons
-                    download_id = notification.extra_data.get("download_id")
-                    message_id = await self.handler.send_approval_request(
-                        download_id=download_id,
-                        message=notification.message,
-                    )
-                else:
-                    # Simple notification
-                    message_id = await self.handler.send_notification(
-                        message=notification.message,
-                        parse_mode=notification.parse_mode or "HTML",
-                        disable_notification=notification.disable_notification,
-                    )
-
-                if message_id:
-                    notification.status = "sent"
-                    notification.sent_at = datetime.now()
-                    notification.telegram_message_id = message_id
-                    sent_count += 1
-                    logger.info("notification.sent", id=notification.id)
-                else:
-                    notification.status = "failed"
-                    notification.attempts += 1
-                    notification.last_error = "Failed to send message"
-                    logger.error("notification.send_failed", id=notification.id)
-
-            except Exception as e:
-                notification.status = "failed"
-                notification.attempts += 1
-                notification.last_error = str(e)
-                logger.error("notification.send_error", id=notification.id, error=str(e))
-
-            await self.db.commit()
+            if notification.reply_markup:
+                sent_count += await self._send_approval(notification)
+            else:
+                key = (
+                    notification.notification_type,
+                    notification.parse_mode or "HTML",
+                    notification.disable_notification,
+                )
+                held.setdefault(key, []).append(notification)
+
+        for key in list(held):
+            _, parse_mode, disable_notification = key
+            batches = _pack_messages(held.pop(key))
+            if not flush:
+                held[key] = batches.pop()
+            for batch in batches:
+                sent_count += await self._send_batch(batch, parse_mode, disable_notification)
 
         return sent_count
+
+    async def _send_approval(self, notification: NotificationQueue) -> int:
+        """Send a single approval request with its inline keyboard"""
+        message_id = None
+        error = "Failed to send message"
+
+        try:
+            download_id = notification.extra_data.get("download_id")
+            message_id = await self.handler.send_approval_request(
+                download_id=download_id,
+                message=notification.message,
+            )
+        except Exception as e:
+            error = str(e)
+
+        _record_result(notification, message_id, error)
+        await self.db.commit()
+
+        return 1 if message_id else 0
+
+    async def _send_batch(
+        self,
+        batch: list[NotificationQueue],
+        parse_mode: str,
+        disable_notification: bool,
+    ) -> int:
+        """Send several simple notifications as one Telegram message"""
+        message_id = None
+        error = "Failed to send message"
+
+        try:
+            message_id = await self.handler.send_notification(
+                message=MESSAGE_SEPARATOR.join(n.message for n in batch),
+                parse_mode=parse_mode,
+                disable_notification=disable_notification,
+            )
+        except Exception as e:
+            error = str(e)
+
+        for notification in batch:
+            _record_result(notification, message_id, error)
+        await self.db.commit()
+
+        return len(batch) if message_id else 0
+
+
+def _wrap_point(line: str, limit: int) -> int:
+    """Last cut at or before limit that isn't inside an HTML tag or entity"""
+    head = line[:limit]
+    cut = limit
+    # Telegram rejects a part ending in "<b" or "&am" ("can't parse entities")
+    tag = head.rfind("<")
+    if tag > head.rfind(">"):
+        cut = tag
+    entity = head.rfind("&")
+    if entity > head.rfind(";"):
+        cut = min(cut, entity)
+    # Nothing safe to cut before; a tag this long isn't real markup
+    return cut or limit
+
+
+def _open_tags(text: str) -> list[tuple[str, str]]:
+    """Tags opened but not closed in text, outermost first, as (name, opening tag)"""
+    stack: list[tuple[str, str]] = []
+    for match in _TAG_RE.finditer(text):
+        closing, name = match.group(1), match.group(2).lower()
+        if not closing:
+            stack.append((name, match.group(0)))
+            continue
+        for index in range(len(stack) - 1, -1, -1):
+            if stack[index][0] == name:
+                del stack[index:]
+                break
+    return stack
+
+
+def _hard_wrap(line: str, limit: int) -> tuple[str, str]:
+    """
+    Cut an over-long line into a part that fits limit and the rest of the line
+
+    Tags still open at the cut are closed at the end of the part and reopened
+    at the start of the rest, since Telegram rejects a part with an unclosed
+    tag ("can't find end tag").
+    """
+    budget = limit
+    while True:
+        cut = _wrap_point(line, budget)
+        open_tags = _open_tags(line[:cut])
+        closing = "".join(f"</{name}>" for name, _ in reversed(open_tags))
+        if cut + len(closing) <= limit or budget <= len(closing):
+            break
+        budget = limit - len(closing)
+    reopening = "".join(tag for _, tag in open_tags)
+    return line[:cut] + closing, reopening + line[cut:]
+
+
+def _split_message(message: str) -> list[str]:
+    """Split a message on line boundaries into parts that each fit one message"""
+    if len(message) <= TELEGRAM_MAX_MESSAGE_LENGTH:
+        return [message]
+
+    limit = TELEGRAM_MAX_MESSAGE_LENGTH - CONTINUATION_RESERVE
+    parts: list[str] = []
+    current: list[str] = []
+    length = 0
+
+    for line in message.split("\n"):
+        # A single line over the limit is hard-wrapped on its own
+        while len(line) > limit:
+            if current:
+                parts.append("\n".join(current))
+                current = []
+                length = 0
+            part, line = _hard_wrap(line, limit)
+            parts.append(part)
+
+        added = len(line) + (1 if current else 0)
+        if current and length + added > limit:
+            parts.append("\n".join(current))
+            current = []
+            added = len(line)
+            length = 0
+        current.append(line)
+        length += added
+
+    if current:
+        parts.append("\n".join(current))
+
+    total = len(parts)
+    return [parts[0]] + [
+        f"<i>(continued {index}/{total})</i>\n{part}"
+        for index, part in enumerate(parts[1:], start=2)
+    ]
+
+
+def _pack_messages(notifications: list[NotificationQueue]) -> list[list[NotificationQueue]]:
+    """Split notifications into batches whose joined text fits one message"""
+    batches: list[list[NotificationQueue]] = []
+    current: list[NotificationQueue] = []
+    length = 0
+
+    for notification in notifications:
+        added = len(notification.message) + (len(MESSAGE_SEPARATOR) if current else 0)
+        if current and length + added > TELEGRAM_MAX_MESSAGE_LENGTH:
+            batches.append(current)
+            current = []
+            added = len(notification.message)
+            length = 0
+        current.append(notification)
+        length += added
+
+    if current:
+        batches.append(current)
+
+    return batches
+
+
+def _record_result(
+    notification: NotificationQueue,
+    message_id: int | None,
+    error: str,
+) -> None:
+    """Update a queued notification after a send attempt"""
+    if message_id:
+        notification.status = "sent"
+        notification.sent_at = datetime.now()
+        notification.telegram_message_id = message_id
+        logger.info("notification.sent", id=notification.id)
+    else:
+        notification.status = "failed"
+        notification.attempts += 1
+        notification.last_error = error
+        logger.error("notification.send_failed", id=notification.id, error=error)
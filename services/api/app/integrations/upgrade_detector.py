@@ -3,6 +3,8 @@ Upgrade Detector
 Implements 17 notification rules for determining upgrade eligibility
 """
 import re
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from app.core.config import get_settings
@@ -40,6 +42,9 @@ class UpgradeDetector:
     ATMOS_PATTERN = re.compile(r"(Atmos|TrueHD)", re.IGNORECASE)
     HDR_PATTERN = re.compile(r"\b(HDR10?|HDR)\b", re.IGNORECASE)
 
+    # Rank used by the resolution-upgrade rule; unknown resolutions rank 0
+    RESOLUTION_ORDER = MappingProxyType({"720p": 1, "1080p": 2, "2160p": 3})
+
     def __init__(self):
         """Initialize upgrade detector with settings"""
         self.settings = get_settings()
@@ -54,6 +59,13 @@ class UpgradeDetector:
         Returns:
             dict: Parsed quality information
         """
+        # Copy so callers can't mutate the cached entry
+        return dict(self._parse_quality(title))
+
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _parse_quality(title: str) -> dict[str, Any]:
+        """Cached title parse; the same torrents are re-evaluated every scan"""
         quality = {
             "resolution": None,
             "has_dv": False,
@@ -64,7 +76,7 @@ class UpgradeDetector:
         }
 
         # Resolution
-        res_match = self.RESOLUTION_PATTERN.search(title)
+        res_match = UpgradeDetector.RESOLUTION_PATTERN.search(title)
         if res_match:
             res = res_match.group(1).lower()
             if res in ("2160p", "4k", "uhd"):
@@ -75,25 +87,25 @@ class UpgradeDetector:
                 quality["resolution"] = "720p"
 
         # Dolby Vision
-        if self.DV_PATTERN.search(title):
+        if UpgradeDetector.DV_PATTERN.search(title):
             quality["has_dv"] = True
 
         # FEL
-        if self.FEL_PATTERN.search(title):
+        if UpgradeDetector.FEL_PATTERN.search(title):
             quality["has_fel"] = True
             quality["dv_profile"] = "P7"
 
         # DV Profile
-        profile_match = self.PROFILE_PATTERN.search(title)
+        profile_match = UpgradeDetector.PROFILE_PATTERN.search(title)
         if profile_match:
             quality["dv_profile"] = f"P{profile_match.group(1)}"
 
         # Atmos
-        if self.ATMOS_PATTERN.search(title):
+        if UpgradeDetector.ATMOS_PATTERN.search(title):
             quality["has_atmos"] = True
 
         # HDR (but not if DV is present)
-        if self.HDR_PATTERN.search(title) and not quality["has_dv"]:
+        if UpgradeDetector.HDR_PATTERN.search(title) and not quality["has_dv"]:
             quality["has_hdr"] = True
 
         return quality
@@ -235,9 +247,8 @@ class UpgradeDetector:
                 new_res = new_quality["resolution"]
 
                 # Check if it's an upgrade
-                res_order = {"720p": 1, "1080p": 2, "2160p": 3}
-                current_order = res_order.get(current_res, 0)
-                new_order = res_order.get(new_res, 0)
+                current_order = self.RESOLUTION_ORDER.get(current_res, 0)
+                new_order = self.RESOLUTION_ORDER.get(new_res, 0)
 
                 if new_order > current_order:
                     return True, f"{current_res}→{new_res}", is_duplicate
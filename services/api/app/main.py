@@ -8,13 +8,12 @@ from typing import AsyncGenerator
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
-from prometheus_client import make_asgi_app
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import get_settings
 from app.core.database import close_db, init_db
 from app.core.logging import get_logger, setup_logging
-from app.core.metrics import PrometheusMiddleware, metrics_endpoint
+from app.core.metrics import metrics_endpoint
 
 # Initialize logging first
 settings = get_settings()
@@ -67,11 +66,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     app.state.scheduler = TaskScheduler()
     await app.state.scheduler.start()
 
-    # Initialize Telegram handler if enabled
+    # Expose the scheduler's Telegram handler rather than starting a second
+    # bot application; the scheduler owns (and shuts down) the instance
     if settings.TELEGRAM_ENABLED:
-        from app.integrations.telegram.handler import TelegramHandler
-        app.state.telegram = TelegramHandler()
-        await app.state.telegram.initialize()
+        app.state.telegram = await app.state.scheduler.get_telegram_handler()
 
     logger.info("app.startup_complete")
 
@@ -84,9 +82,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     if hasattr(app.state, "scheduler"):
         await app.state.scheduler.shutdown()
 
-    # Shutdown Telegram handler
-    if hasattr(app.state, "telegram"):
-        await app.state.telegram.shutdown()
+    # Close the scanner's shared Plex HTTP session and parsing pool
+    from app.integrations.plex.scanner import PlexScanner
+    await PlexScanner.close_shared_session()
+
+    # Close the IPT scraper's FlareSolverr client
+    from app.services.ipt_scraper import close_scraper
+    await close_scraper()
+
+    # Close the chart proxy's AntV client
+    from app.api.v1.viz import close_client
+    await close_client()
+
+    # Close the IPT download endpoint's Radarr/qbitcopy client
+    from app.api.v1.ipt import close_client as close_ipt_client
+    await close_ipt_client()
 
     # Close database connections
     await close_db()
@@ -103,6 +113,8 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    # Every JSON endpoint renders through orjson (C) instead of stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -133,7 +145,7 @@ app.add_middleware(GZipMiddleware, minimum_size=1000)
 @app.get("/health", tags=["health"])
 async def health_check():
     """Basic health check endpoint"""
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "status": "healthy",
             "app": settings.APP_NAME,
@@ -173,7 +185,7 @@ async def readiness_check():
 
     all_healthy = all(status == "healthy" for status in checks.values())
 
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "status": "ready" if all_healthy else "not_ready",
             "checks": checks,
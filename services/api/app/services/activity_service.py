@@ -2,6 +2,7 @@
 Activity Service
 Manages the chronological activity feed
 """
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from sqlalchemy import func, select
@@ -108,8 +109,6 @@ class ActivityService:
 
     async def get_recent_summary(self, hours: int = 24) -> dict[str, Any]:
         """Get summary of activity in the last N hours"""
-        from datetime import datetime, timedelta, timezone
-
         cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
 
         query = select(ActivityLog).where(ActivityLog.created_at >= cutoff)
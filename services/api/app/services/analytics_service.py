@@ -4,7 +4,7 @@ Quality reports, storage analytics, duplicate detection, upgrade availability
 """
 from typing import Any
 
-from sqlalchemy import case, cast, func, select, text, Float, Integer as SQLInt
+from sqlalchemy import and_, case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
@@ -106,34 +106,6 @@ class AnalyticsService:
         )
         audio_dist = {a: c for a, c in audio_result.fetchall()}
 
-        # Atmos count
-        atmos_result = await self.db.execute(
-            select(func.count()).select_from(Movie).where(Movie.has_atmos == True)
-        )
-        atmos_count = atmos_result.scalar() or 0
-
-        # FEL count
-        fel_result = await self.db.execute(
-            select(func.count()).select_from(Movie).where(Movie.dv_fel == True)
-        )
-        fel_count = fel_result.scalar() or 0
-
-        # DV count
-        dv_result = await self.db.execute(
-            select(func.count())
-            .select_from(Movie)
-            .where(Movie.dv_profile.isnot(None))
-        )
-        dv_count = dv_result.scalar() or 0
-
-        # 4K count
-        fourk_result = await self.db.execute(
-            select(func.count())
-            .select_from(Movie)
-            .where(Movie.resolution.in_(["2160p", "4K"]))
-        )
-        fourk_count = fourk_result.scalar() or 0
-
         # Quality tiers
         quality_tiers = {
             "reference": 0,    # P7 FEL + Atmos + 4K
@@ -144,7 +116,9 @@ class AnalyticsService:
             "needs_upgrade": 0, # 1080p SDR or lower
         }
 
-        # Classify each movie into a tier
+        # Classify each movie into a tier, counting DV/FEL/Atmos/4K in the
+        # same pass rather than issuing a separate COUNT query for each
+        atmos_count = fel_count = dv_count = fourk_count = 0
         movies_result = await self.db.execute(
             select(
                 Movie.dv_fel,
@@ -159,6 +133,11 @@ class AnalyticsService:
             is_dv = dv_profile is not None
             is_hdr = hdr_type and hdr_type.lower() not in ("sdr", "", None)
 
+            dv_count += is_dv
+            fel_count += bool(dv_fel)
+            atmos_count += bool(has_atmos)
+            fourk_count += is_4k
+
             if dv_fel and has_atmos and is_4k:
                 quality_tiers["reference"] += 1
             elif is_dv and has_atmos and is_4k:
@@ -286,13 +265,33 @@ class AnalyticsService:
         multi_version_movies = multi_version.scalars().all()
 
         # Also find distinct titles that appear multiple times
-        dup_titles = await self.db.execute(
+        dup_groups = (
             select(Movie.title, Movie.year, func.count(Movie.id).label("count"))
             .group_by(Movie.title, Movie.year)
             .having(func.count(Movie.id) > 1)
         )
+        dup_titles = await self.db.execute(dup_groups)
         duplicate_title_groups = dup_titles.fetchall()
 
+        # Load the entries of every duplicated title in one query and bucket
+        # them by (title, year), rather than one query per group
+        entries_by_group: dict[tuple[str, int | None], list[Movie]] = {}
+        if duplicate_title_groups:
+            groups = dup_groups.subquery()
+            entries_result = await self.db.execute(
+                select(Movie)
+                .join(
+                    groups,
+                    and_(
+                        Movie.title == groups.c.title,
+                        Movie.year.is_not_distinct_from(groups.c.year),
+                    ),
+                )
+                .order_by(Movie.dv_fel.desc(), Movie.has_atmos.desc())
+            )
+            for entry in entries_result.scalars().all():
+                entries_by_group.setdefault((entry.title, entry.year), []).append(entry)
+
         duplicates = []
 
         # Handle multi-version movies
@@ -313,12 +312,7 @@ class AnalyticsService:
 
         # Handle duplicate title entries
         for title, year, count in duplicate_title_groups:
-            entries_result = await self.db.execute(
-                select(Movie)
-                .where(Movie.title == title, Movie.year == year)
-                .order_by(Movie.dv_fel.desc(), Movie.has_atmos.desc())
-            )
-            entries = entries_result.scalars().all()
+            entries = entries_by_group.get((title, year), [])
 
             versions = []
             total_size = 0
@@ -15,15 +15,17 @@ be replaced with direct method calls:
 from __future__ import annotations
 
 import asyncio
-import json
 import os
 import re
+import tempfile
 from collections.abc import AsyncIterator, Callable
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
@@ -39,43 +41,166 @@ _LINK_RE      = re.compile(r'href="((?:https?://iptorrents\.com)?/t/(\d+))"')
 _SIZE_RE      = re.compile(r"([\d.]+\s*[KMGT]?B)")
 _SUB_RE       = re.compile(r'<div class="sub">([^<]+)<')
 _FILESAFE_RE  = re.compile(r"[^a-zA-Z0-9]")
+_NON_DIGIT_RE = re.compile(r"\D")
+_SPACES_RE    = re.compile(r"\s+")
 
 KNOWN_LIMIT = 1000
 
+# path -> (st_mtime_ns, st_size, parsed) so unchanged files aren't re-parsed
+# on every results/known-torrents request
+_json_cache: dict[Path, tuple[int, int, Any]] = {}
+
+# path -> (parsed payload, expanded records) for the payload last expanded
+_expanded_cache: dict[Path, tuple[Any, list[dict[str, Any]]]] = {}
+
 
 def _settings():
     return get_settings()
 
 
+@lru_cache(maxsize=None)
 def _data_dir() -> Path:
-    # Lives under the api_data volume
+    # Lives under the api_data volume. Settings are fixed per process, so the
+    # path is resolved (and the directory created) once rather than per call.
     root = Path(os.getenv("IPT_DATA_DIR") or str(Path(_settings().DATA_DIR) / "ipt"))
     root.mkdir(parents=True, exist_ok=True)
     return root
 
 
+@lru_cache(maxsize=128)
+def _log_event(message: str) -> str:
+    # Scan progress messages are mostly fixed strings, so each one's structlog
+    # event name is derived once instead of on every emit
+    return "ipt.scraper." + _SPACES_RE.sub("_", message.lower().strip())[:40]
+
+
+# The file paths hang off the fixed data dir, so each is joined once; the
+# same Path object also keeps its cached hash for the _json_cache lookups
+@lru_cache(maxsize=None)
 def _known_file() -> Path:
     return _data_dir() / "known_torrents.json"
 
 
+@lru_cache(maxsize=None)
 def _latest_file() -> Path:
     return _data_dir() / "latest_results.json"
 
 
+@lru_cache(maxsize=None)
+def _pretty_json() -> bool:
+    return os.getenv("IPT_PRETTY_JSON", "").lower() in ("1", "true", "yes")
+
+
+def _json_dumps(data) -> bytes:
+    # Compact by default: the files are only machine-read. Set
+    # IPT_PRETTY_JSON=1 to get indented output for hand inspection.
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 if _pretty_json() else None)
+
+
 def _load_json(path: Path, default):
+    # The parsed value is shared between callers; treat it as read-only
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        st = path.stat()
+        cached = _json_cache.get(path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        data = orjson.loads(path.read_bytes())
     except FileNotFoundError:
+        _json_cache.pop(path, None)
         return default
-    except (json.JSONDecodeError, OSError) as exc:
+    except (ValueError, OSError) as exc:
         logger.warning("ipt.scraper.read_failed", path=str(path), error=str(exc))
         return default
 
+    # If the file was replaced between stat() and the read, the stale key
+    # just forces a re-read next time
+    _json_cache[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
 
 def _write_json_atomic(path: Path, data) -> None:
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
-    os.replace(tmp, path)
+    # Unique temp file in the same directory so concurrent writers (scan vs
+    # clear) can't interleave, fsync'd so a crash never leaves a truncated
+    # file behind os.replace.
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(_json_dumps(data))
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+        st = path.stat()
+        _json_cache[path] = (st.st_mtime_ns, st.st_size, data)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _torrent_link(torrent_id: str) -> str:
+    return f"https://iptorrents.com/t/{torrent_id}"
+
+
+def _download_url(torrent_id: str, title: str) -> str:
+    slug = _FILESAFE_RE.sub("_", title)
+    return f"https://iptorrents.com/download.php/{torrent_id}/{slug}.torrent"
+
+
+# Fields rebuilt from id/name on load rather than stored once per torrent
+_DERIVED_FIELDS = frozenset({"link", "downloadUrl"})
+
+
+def _compact(records: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Pack same-shaped records as {"columns": [...], "rows": [[...], ...]}
+
+    Field names are written once instead of once per torrent, and the URL
+    fields derived from id/name are left out, which keeps the cache files a
+    fraction of their list-of-dicts size.
+    """
+    columns = [
+        key
+        for key in dict.fromkeys(key for record in records for key in record)
+        if key not in _DERIVED_FIELDS
+    ]
+    return {
+        "columns": columns,
+        "rows": [[record.get(col) for col in columns] for record in records],
+    }
+
+
+def _expand(data) -> list[dict[str, Any]]:
+    """Inverse of _compact; legacy list-of-dict payloads pass through as-is"""
+    if not (isinstance(data, dict) and "columns" in data and "rows" in data):
+        return data
+
+    columns = data["columns"]
+    records = []
+    for row in data["rows"]:
+        record = dict(zip(columns, row))
+        torrent_id = record.get("id")
+        if torrent_id:
+            record["link"] = _torrent_link(torrent_id)
+            record["downloadUrl"] = _download_url(torrent_id, record.get("name") or "")
+        records.append(record)
+    return records
+
+
+def _expand_cached(path: Path, data) -> list[dict[str, Any]]:
+    # _load_json hands back the same object while the file is unchanged, so
+    # its expansion is kept alongside it and shared (read-only) as well
+    cached = _expanded_cache.get(path)
+    if cached is not None and cached[0] is data:
+        return cached[1]
+    records = _expand(data)
+    _expanded_cache[path] = (data, records)
+    return records
+
+
+def _load_known() -> list[dict[str, Any]]:
+    return _expand_cached(_known_file(), _load_json(_known_file(), []))
 
 
 def _parse_torrents(html: str) -> list[dict[str, Any]]:
@@ -84,6 +209,8 @@ def _parse_torrents(html: str) -> list[dict[str, Any]]:
         logger.warning("ipt.scraper.no_table_in_html")
         return []
 
+    # Every row on a page is stamped with the same scrape time
+    scraped_at = datetime.now(timezone.utc).isoformat()
     out: list[dict[str, Any]] = []
     for row_match in _ROW_RE.finditer(tbody_match.group(1)):
         row_html = row_match.group(1)
@@ -107,17 +234,17 @@ def _parse_torrents(html: str) -> list[dict[str, Any]]:
             raw_link = link_match.group(1)
             link = raw_link if raw_link.startswith("http") else f"https://iptorrents.com{raw_link}"
         else:
-            link = f"https://iptorrents.com/t/{torrent_id}"
+            link = _torrent_link(torrent_id)
 
         size_match = _SIZE_RE.search(cells[5])
         size = size_match.group(1).strip() if size_match else None
 
         try:
-            seeders = int(re.sub(r"\D", "", cells[7].strip()) or 0)
+            seeders = int(_NON_DIGIT_RE.sub("", cells[7].strip()) or 0)
         except ValueError:
             seeders = 0
         try:
-            leechers = int(re.sub(r"\D", "", cells[8].strip()) or 0)
+            leechers = int(_NON_DIGIT_RE.sub("", cells[8].strip()) or 0)
         except ValueError:
             leechers = 0
 
@@ -130,7 +257,6 @@ def _parse_torrents(html: str) -> list[dict[str, Any]]:
             if len(parts) > 1:
                 added = parts[1].strip()
 
-        slug = _FILESAFE_RE.sub("_", title)
         out.append(
             {
                 "id": torrent_id,
@@ -141,8 +267,8 @@ def _parse_torrents(html: str) -> list[dict[str, Any]]:
                 "leechers": leechers,
                 "added": added,
                 "isNew": is_new,
-                "downloadUrl": f"https://iptorrents.com/download.php/{torrent_id}/{slug}.torrent",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "downloadUrl": _download_url(torrent_id, title),
+                "timestamp": scraped_at,
             }
         )
 
@@ -166,14 +292,18 @@ class IPTScraper:
         self.hide_cats = os.getenv("IPT_HIDE_CATS", "0")
         self.hide_top  = os.getenv("IPT_HIDE_TOP", "0")
         self.scan_pages = int(os.getenv("SCAN_PAGES", "1") or 1)
-
-    async def _solve(self, url: str) -> str:
-        if not self.flaresolverr_url:
-            raise RuntimeError(
-                "FLARESOLVERR_URL not configured. Set it in docker-compose env "
-                "(e.g. http://flaresolverr:8191)."
-            )
-
+        # The FlareSolverr scan currently running, shared by every caller
+        self._inflight: asyncio.Task[list[dict[str, Any]]] | None = None
+        # Serializes updates to known_torrents.json (scan merge vs clear)
+        self._known_lock = asyncio.Lock()
+        # Credentials are fixed for the process, so the cookie payload sent
+        # with every page request is built once
+        self._cookies = self._build_cookies()
+        # Reused across pages and scans so FlareSolverr requests keep their
+        # connection alive instead of reconnecting per page
+        self._client: httpx.AsyncClient | None = None
+
+    def _build_cookies(self) -> list[dict[str, str]]:
         cookies: list[dict[str, str]] = [
             {"name": "uid",  "value": self.ipt_uid},
             {"name": "pass", "value": self.ipt_pass},
@@ -184,19 +314,59 @@ class IPTScraper:
             cookies.append({"name": "hideCats", "value": self.hide_cats})
         if self.hide_top and self.hide_top != "0":
             cookies.append({"name": "hideTop", "value": self.hide_top})
+        return cookies
 
-        async with httpx.AsyncClient(timeout=65.0) as client:
-            resp = await client.post(
-                f"{self.flaresolverr_url}/v1",
-                json={
-                    "cmd": "request.get",
-                    "url": url,
-                    "maxTimeout": 60000,
-                    "cookies": cookies,
-                },
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=65.0)
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared FlareSolverr HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def is_scanning(self) -> bool:
+        return self._inflight is not None and not self._inflight.done()
+
+    def start_scan(self) -> bool:
+        """
+        Start a scan in the background and return immediately
+
+        Returns:
+            bool: False if a scan was already running (it is left to finish)
+        """
+        if self.is_scanning:
+            return False
+
+        def _log_failure(task: asyncio.Task) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                logger.error("ipt.scraper.background_scan_failed", error=str(task.exception()))
+
+        self._inflight = asyncio.create_task(self._scan())
+        self._inflight.add_done_callback(_log_failure)
+        return True
+
+    async def _solve(self, url: str) -> str:
+        if not self.flaresolverr_url:
+            raise RuntimeError(
+                "FLARESOLVERR_URL not configured. Set it in docker-compose env "
+                "(e.g. http://flaresolverr:8191)."
             )
-            resp.raise_for_status()
-            body = resp.json()
+
+        resp = await self._get_client().post(
+            f"{self.flaresolverr_url}/v1",
+            json={
+                "cmd": "request.get",
+                "url": url,
+                "maxTimeout": 60000,
+                "cookies": self._cookies,
+            },
+        )
+        resp.raise_for_status()
+        body = resp.json()
 
         if body.get("status") != "ok":
             raise RuntimeError(f"FlareSolverr failed: {body.get('message')}")
@@ -206,13 +376,42 @@ class IPTScraper:
     async def scan(
         self,
         on_log: Callable[[dict[str, Any]], None] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Run a scan, or join the one already in progress
+
+        Only one FlareSolverr scan runs at a time; concurrent callers (manual
+        trigger, SSE stream, scheduler) wait for the same result. The scan is
+        shielded, so a caller going away doesn't abort it for the others and
+        its results are still persisted.
+
+        A caller that joins a running scan only gets the "already in
+        progress" event on ``on_log``; the scan's progress events keep going
+        to the caller that started it.
+        """
+        task = self._inflight
+        if task is not None and not task.done():
+            if on_log is not None:
+                on_log(
+                    {
+                        "timestamp": datetime.now(timezone.utc),
+                        "message": "Scan already in progress, waiting for it to finish",
+                    }
+                )
+        else:
+            task = self._inflight = asyncio.create_task(self._scan(on_log))
+        return await asyncio.shield(task)
+
+    async def _scan(
+        self,
+        on_log: Callable[[dict[str, Any]], None] | None = None,
     ) -> list[dict[str, Any]]:
         def emit(message: str, **extra: Any) -> None:
-            logger.info("ipt.scraper." + re.sub(r"\s+", "_", message.lower().strip())[:40], **extra)
+            logger.info(_log_event(message), **extra)
             if on_log is not None:
                 on_log(
                     {
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": datetime.now(timezone.utc),
                         "message": message,
                         **extra,
                     }
@@ -239,25 +438,30 @@ class IPTScraper:
         emit("Deduplication complete", unique_torrents=len(unique))
 
         emit("Checking for new torrents...")
-        known = await asyncio.to_thread(_load_json, _known_file(), [])
-        known_ids = {t["id"] for t in known}
-        results = [{**t, "isNew": t["id"] not in known_ids} for t in unique]
-        new_torrents = [t for t in results if t["isNew"]]
-
-        if new_torrents:
-            emit("New torrents discovered!", new_count=len(new_torrents))
-            updated = known + [
-                {k: v for k, v in t.items() if k != "isNew"} for t in new_torrents
-            ]
-            await asyncio.to_thread(_write_json_atomic, _known_file(), updated[-KNOWN_LIMIT:])
-            emit("Cache updated")
-        else:
-            emit("No new torrents found")
+        # Held across the read-modify-write so a concurrent clear can't be
+        # overwritten with the pre-clear list
+        async with self._known_lock:
+            known = await asyncio.to_thread(_load_known)
+            known_ids = {t["id"] for t in known}
+            results = [{**t, "isNew": t["id"] not in known_ids} for t in unique]
+            new_torrents = [t for t in results if t["isNew"]]
+
+            if new_torrents:
+                emit("New torrents discovered!", new_count=len(new_torrents))
+                updated = known + [
+                    {k: v for k, v in t.items() if k != "isNew"} for t in new_torrents
+                ]
+                await asyncio.to_thread(
+                    _write_json_atomic, _known_file(), _compact(updated[-KNOWN_LIMIT:])
+                )
+                emit("Cache updated")
+            else:
+                emit("No new torrents found")
 
         await asyncio.to_thread(
             _write_json_atomic,
             _latest_file(),
-            {"timestamp": datetime.now(timezone.utc).isoformat(), "torrents": results},
+            {"timestamp": datetime.now(timezone.utc).isoformat(), "torrents": _compact(results)},
         )
 
         emit("Scan complete!", total=len(results), new=len(new_torrents))
@@ -266,7 +470,8 @@ class IPTScraper:
     async def scan_stream(self) -> AsyncIterator[dict[str, Any]]:
         """
         Async generator yielding log events then a final 'complete' event.
-        Suitable for SSE endpoints.
+        Suitable for SSE endpoints; event timestamps are UTC datetimes, left
+        for orjson to format as they are written out.
         """
         queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
 
@@ -279,7 +484,7 @@ class IPTScraper:
                 await queue.put(
                     {
                         "type": "complete",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": datetime.now(timezone.utc),
                         "results": {
                             "total": len(results),
                             "new": sum(1 for r in results if r["isNew"]),
@@ -290,7 +495,7 @@ class IPTScraper:
                 await queue.put(
                     {
                         "type": "error",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": datetime.now(timezone.utc),
                         "message": str(exc),
                     }
                 )
@@ -312,13 +517,17 @@ class IPTScraper:
         data = await asyncio.to_thread(
             _load_json, _latest_file(), {"timestamp": None, "torrents": []}
         )
-        return data
+        return {**data, "torrents": _expand_cached(_latest_file(), data.get("torrents", []))}
 
     async def get_known_torrents(self) -> list[dict[str, Any]]:
-        return await asyncio.to_thread(_load_json, _known_file(), [])
+        return await asyncio.to_thread(_load_known)
 
     async def clear_known_torrents(self) -> None:
-        await asyncio.to_thread(_write_json_atomic, _known_file(), [])
+        # The load is served from _json_cache, so an already-empty cache costs
+        # one stat() instead of a full temp-file write, fsync and rename
+        async with self._known_lock:
+            if await asyncio.to_thread(_load_known):
+                await asyncio.to_thread(_write_json_atomic, _known_file(), [])
         logger.info("ipt.scraper.known_cleared")
 
 
@@ -331,3 +540,9 @@ def get_scraper() -> IPTScraper:
     if _default is None:
         _default = IPTScraper()
     return _default
+
+
+async def close_scraper() -> None:
+    """Release the singleton's HTTP client on application shutdown"""
+    if _default is not None:
+        await _default.close()
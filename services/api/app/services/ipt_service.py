@@ -2,29 +2,64 @@
 IPT Scanner Service
 Communicates with the IPT scraper microservice
 """
+import asyncio
 import re
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 import httpx
-from sqlalchemy import func, select
+import orjson
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.models.movie import Movie
 from app.services.ipt_scraper import get_scraper
+from app.utils import library_cache
 from app.utils.torrent_parser import TorrentTitleParser
 
 logger = get_logger(__name__)
 
+_APOSTROPHE_RE = re.compile(r"[''`]")
+_PUNCTUATION_RE = re.compile(r"[^a-z0-9\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Radarr's catalogue is fetched in full to build its index, so the index is
+# reused across results requests for a few minutes instead of per request
+RADARR_INDEX_TTL_SECONDS = 300
+_radarr_index: dict[str, Any] = {"expires": 0.0, "index": None}
+
+# Enriched latest results and the (torrents, library index, Radarr index)
+# objects they were built from
+_enriched_results: dict[str, Any] = {"inputs": None, "torrents": None}
+
+# /ipt/health is polled by the UI and only ever returns one of these two
+_HEALTH_OK = {
+    "status": "healthy",
+    "message": "IPT scraper (in-process) ready",
+    "uptime": 0,
+}
+_HEALTH_DEGRADED = {
+    "status": "degraded",
+    "message": "IPT scraper running in-process — FLARESOLVERR_URL not set",
+}
+
+
+def invalidate_radarr_index() -> None:
+    """Drop the cached Radarr index; call after adding a movie to Radarr"""
+    _radarr_index["index"] = None
+    _radarr_index["expires"] = 0.0
+
 
 def _normalize_title(title: str) -> str:
     """Normalize a title for fuzzy matching: lowercase, strip punctuation, collapse spaces"""
     t = title.lower().strip()
-    t = re.sub(r"[''`]", "", t)          # Remove apostrophes
-    t = re.sub(r"[^a-z0-9\s]", " ", t)   # Replace punctuation with space
-    t = re.sub(r"\s+", " ", t).strip()    # Collapse whitespace
+    t = _APOSTROPHE_RE.sub("", t)         # Remove apostrophes
+    t = _PUNCTUATION_RE.sub(" ", t)       # Replace punctuation with space
+    t = _WHITESPACE_RE.sub(" ", t).strip()  # Collapse whitespace
     return t
 
 
@@ -66,10 +101,16 @@ class IPTService:
         """
         Build a lookup index from the movie database for matching against torrent titles.
         Key: normalized title + year → movie quality info
+
+        The index is cached until the movies table next changes.
         """
         if not self.db:
             return {}
 
+        return await library_cache.cached("ipt_library_index", self._load_library_index)
+
+    async def _load_library_index(self) -> dict[str, dict[str, Any]]:
+        """Query the movie database and build the library index"""
         result = await self.db.execute(
             select(
                 Movie.title,
@@ -133,11 +174,17 @@ class IPTService:
         """
         Build lookup index from Radarr to know which movies are managed.
         Key: normalized title + year → True
+
+        A successfully built index is reused for RADARR_INDEX_TTL_SECONDS.
         """
         settings = get_settings()
         if not settings.RADARR_URL or not settings.RADARR_API_KEY:
             return {}
 
+        now = time.monotonic()
+        if _radarr_index["index"] is not None and now < _radarr_index["expires"]:
+            return _radarr_index["index"]
+
         try:
             async with httpx.AsyncClient(timeout=15.0) as client:
                 resp = await client.get(
@@ -146,7 +193,7 @@ class IPTService:
                 )
                 if resp.status_code != 200:
                     return {}
-                movies = resp.json()
+                movies = orjson.loads(resp.content)
         except Exception as e:
             logger.warning("ipt.radarr_index_failed", error=str(e))
             return {}
@@ -168,6 +215,8 @@ class IPTService:
                         index[f"{alt_norm}|{year}"] = True
                     index[f"{alt_norm}|"] = True
 
+        _radarr_index["index"] = index
+        _radarr_index["expires"] = now + RADARR_INDEX_TTL_SECONDS
         return index
 
     def _match_library(
@@ -178,33 +227,27 @@ class IPTService:
     ) -> dict[str, Any]:
         """Match a torrent's parsed metadata against the library and radarr indexes"""
         clean_title = metadata.get("clean_title", "")
-        year = metadata.get("year")
-
         if not clean_title:
             return {"in_library": False, "in_radarr": False}
 
+        # Both indexes share the key format, so the keys are built once and
+        # probed against each
         norm = _normalize_title(clean_title)
+        year = metadata.get("year")
+        year_key = f"{norm}|{year}" if year else None
+        title_key = f"{norm}|"
 
         # Check radarr
-        in_radarr = False
-        if radarr_index:
-            if year and f"{norm}|{year}" in radarr_index:
-                in_radarr = True
-            elif f"{norm}|" in radarr_index:
-                in_radarr = True
-
-        # Try exact title + year match first
-        if year:
-            key = f"{norm}|{year}"
-            if key in library_index:
-                result = library_index[key].copy()
-                result["in_radarr"] = in_radarr
-                return result
-
-        # Fallback: title-only match
-        key = f"{norm}|"
-        if key in library_index:
-            result = library_index[key].copy()
+        in_radarr = bool(radarr_index) and (
+            (year_key is not None and year_key in radarr_index) or title_key in radarr_index
+        )
+
+        # Try exact title + year match first, then fall back to title only
+        entry = library_index.get(year_key) if year_key is not None else None
+        if entry is None:
+            entry = library_index.get(title_key)
+        if entry is not None:
+            result = entry.copy()
             result["in_radarr"] = in_radarr
             return result
 
@@ -226,16 +269,27 @@ class IPTService:
             }
 
         torrents = raw.get("torrents", []) or []
-        library_index = await self._build_library_index()
-        radarr_index  = await self._build_radarr_index()
-
-        enriched = []
-        for t in torrents:
-            row = self._enrich_torrent(t)
-            row["library"] = self._match_library(
-                row.get("metadata", {}), library_index, radarr_index
-            )
-            enriched.append(row)
+        library_index, radarr_index = await asyncio.gather(
+            self._build_library_index(), self._build_radarr_index()
+        )
+
+        # All three inputs are the same objects until the results file, the
+        # library or the Radarr index changes, so steady-state polls reuse the
+        # last enrichment. The shared list is read-only.
+        inputs = (torrents, library_index, radarr_index)
+        cached = _enriched_results["inputs"]
+        if cached is not None and all(
+            new is old or (not new and not old) for new, old in zip(inputs, cached)
+        ):
+            enriched = _enriched_results["torrents"]
+        else:
+            enriched = []
+            for t in torrents:
+                row = self._enrich_torrent(t)
+                row["library"] = self._match_library(row["metadata"], library_index, radarr_index)
+                enriched.append(row)
+            _enriched_results["inputs"] = inputs
+            _enriched_results["torrents"] = enriched
 
         return {
             "success": True,
@@ -258,15 +312,21 @@ class IPTService:
             dict: Torrent with added 'metadata' field containing parsed data
         """
         title = torrent.get("name") or torrent.get("title", "")
-        metadata = TorrentTitleParser.parse(title)
-        metadata["quality_score"] = TorrentTitleParser.get_quality_score(metadata)
 
-        # Add metadata to torrent
+        # Add metadata to torrent; copied so callers can't mutate the cached parse
         enriched = torrent.copy()
-        enriched["metadata"] = metadata
+        enriched["metadata"] = dict(self._parse_title(title))
 
         return enriched
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_title(title: str) -> dict[str, Any]:
+        """Cached title parse + quality score; known torrents are re-enriched every request"""
+        metadata = TorrentTitleParser.parse(title)
+        metadata["quality_score"] = TorrentTitleParser.get_quality_score(metadata)
+        return metadata
+
     async def get_known_torrents(self) -> list[dict[str, Any]]:
         """
         Get known torrents from in-process cache, enriched + sorted by quality.
@@ -278,10 +338,8 @@ class IPTService:
             return []
 
         enriched = [self._enrich_torrent(t) for t in torrents]
-        enriched.sort(
-            key=lambda t: t.get("metadata", {}).get("quality_score", 0),
-            reverse=True,
-        )
+        # Scores were computed once per title during enrichment
+        enriched.sort(key=lambda t: t["metadata"]["quality_score"], reverse=True)
         return enriched
 
     async def clear_cache(self) -> dict[str, str]:
@@ -299,14 +357,6 @@ class IPTService:
         Report scraper health. In-process — always healthy when FlareSolverr
         is configured; reports degraded if not.
         """
-        scraper = get_scraper()
-        if not scraper.flaresolverr_url:
-            return {
-                "status": "degraded",
-                "message": "IPT scraper running in-process — FLARESOLVERR_URL not set",
-            }
-        return {
-            "status": "healthy",
-            "message": "IPT scraper (in-process) ready",
-            "uptime": 0,
-        }
+        if not get_scraper().flaresolverr_url:
+            return dict(_HEALTH_DEGRADED)
+        return dict(_HEALTH_OK)
@@ -3,10 +3,10 @@ Metadata Service
 FFProbe execution and metadata cache management
 """
 import asyncio
-import json
 from datetime import datetime, timedelta
 from typing import Any
 
+import orjson
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -70,7 +70,7 @@ async def run_ffprobe(
         error_msg = stderr.decode().strip() if stderr else "Unknown error"
         raise RuntimeError(f"ffprobe failed (exit {proc.returncode}): {error_msg}")
 
-    ffprobe_data = json.loads(stdout.decode())
+    ffprobe_data = orjson.loads(stdout)
 
     # Split streams by codec_type
     streams = ffprobe_data.get("streams", [])
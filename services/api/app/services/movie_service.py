@@ -2,6 +2,7 @@
 Movie Service
 Business logic for movie operations
 """
+from collections.abc import AsyncIterator
 from typing import Any
 
 from sqlalchemy import func, select
@@ -13,6 +14,27 @@ from app.schemas.movie import MovieFilter
 
 logger = get_logger(__name__)
 
+# Columns written to library reports
+EXPORT_COLUMNS = (
+    Movie.rating_key,
+    Movie.title,
+    Movie.year,
+    Movie.resolution,
+    Movie.video_codec,
+    Movie.hdr_type,
+    Movie.dv_profile,
+    Movie.dv_fel,
+    Movie.dv_bl_compatible,
+    Movie.audio_codec,
+    Movie.has_atmos,
+    Movie.audio_channels,
+    Movie.file_path,
+    Movie.file_size_bytes,
+    Movie.in_dv_collection,
+    Movie.in_p7_collection,
+    Movie.in_atmos_collection,
+)
+
 
 class MovieService:
     """Movie database operations and business logic"""
@@ -191,3 +213,27 @@ class MovieService:
             .limit(limit)
         )
         return result.scalars().all()
+
+    async def iter_export_records(
+        self, batch_size: int = 500
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream movie records for a library report
+
+        Rows come from a server-side cursor in batches of batch_size and
+        are yielded one at a time, so memory stays flat however large the
+        library is.
+
+        Args:
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            dict: One movie record per row
+        """
+        result = await self.db.stream(
+            select(*EXPORT_COLUMNS)
+            .order_by(Movie.title)
+            .execution_options(yield_per=batch_size)
+        )
+        async for row in result.mappings():
+            yield dict(row)
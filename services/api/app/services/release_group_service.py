@@ -4,7 +4,7 @@ Track release group reputation, preferences, and statistics
 """
 from typing import Any
 
-from sqlalchemy import func, select, update
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
@@ -3,6 +3,7 @@ Scan Service
 Orchestrates library scanning with Dolby Vision detection
 """
 import asyncio
+import time
 from datetime import datetime
 from typing import Any
 
@@ -14,9 +15,79 @@ from app.integrations.plex.collection_manager import CollectionManager
 from app.integrations.plex.scanner import PlexScanner
 from app.models.movie import Movie
 from app.models.scan_history import ScanHistory
+from app.utils import library_cache
 
 logger = get_logger(__name__)
 
+# How long status polls reuse the latest scan_history row. Scans run by this
+# process publish their row directly; the TTL picks up other workers' scans.
+LATEST_SCAN_TTL_SECONDS = 10
+
+# Scanned fields that must never overwrite an existing row's columns
+_PROTECTED_COLUMNS = frozenset({"rating_key", "id", "created_at", "updated_at"})
+
+
+def _dedupe_by_rating_key(movies: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Drop repeated rating keys from a scan result, keeping the last occurrence
+
+    Uses a dict keyed by rating_key, so it is O(n) and preserves the order
+    in which each key was first seen.
+    """
+    by_key: dict[str, dict[str, Any]] = {}
+    for movie in movies:
+        by_key[movie["rating_key"]] = movie
+    return list(by_key.values())
+
+
+class ScanProgress:
+    """
+    Progress of the running scan, published for the status endpoint
+
+    update() has the on_progress callback signature. The percentage is taken
+    against a reciprocal computed once per phase total, and the snapshot is
+    only replaced when the integer percent or the phase changes, so a 20k
+    movie scan publishes ~100 snapshots per phase instead of one per batch.
+    Status polls read the snapshot attribute as a single reference, and can
+    await the `changed` event, which fires on every publish.
+    """
+
+    def __init__(self) -> None:
+        self.changed = asyncio.Event()
+        self.reset()
+
+    def reset(self) -> None:
+        self._total = -1
+        self._inv = 0.0
+        self._last_pct = -1
+        self._publish({})
+
+    def _publish(self, snapshot: dict[str, Any]) -> None:
+        self.snapshot = snapshot
+        # Swap in a fresh event so waiters wake once and later ones block again
+        changed, self.changed = self.changed, asyncio.Event()
+        changed.set()
+
+    def update(
+        self, message: str, scanned: int, total: int, current_movie: str | None
+    ) -> None:
+        if total != self._total:
+            self._total = total
+            self._inv = 100.0 / total if total > 0 else 0.0
+            self._last_pct = -1
+        pct = int(scanned * self._inv)
+        # Phase markers carry no total; always publish those
+        if pct == self._last_pct and total > 0:
+            return
+        self._last_pct = pct
+        self._publish({
+            "progress": pct,
+            "message": message,
+            "scanned": scanned,
+            "total": total,
+            "current_movie": current_movie,
+        })
+
 
 class ScanService:
     """
@@ -34,11 +105,15 @@ class ScanService:
     # hammering the same Plex library.
     _scan_lock: asyncio.Lock = asyncio.Lock()
     _current_scan: ScanHistory | None = None
+    progress: ScanProgress = ScanProgress()
+    # (monotonic time read, row) for the most recently started scan
+    _latest_scan: tuple[float, ScanHistory | None] | None = None
 
     def __init__(self, db: AsyncSession):
         self.db = db
         self.scanner = PlexScanner()
-        self.collection_manager = CollectionManager()
+        # Share the scanner's client so a scan connects to Plex once
+        self.collection_manager = CollectionManager(client=self.scanner.client)
 
     async def is_scan_running(self) -> bool:
         """Check if a scan is currently running"""
@@ -68,6 +143,7 @@ class ScanService:
         ids = [row[0] for row in result.all()]
         if ids:
             await db.commit()
+            cls._latest_scan = None
             logger.info("scan.orphaned_reconciled", count=len(ids), ids=ids)
         return len(ids)
 
@@ -107,6 +183,18 @@ class ScanService:
             await self.db.refresh(scan_record)
 
             type(self)._current_scan = scan_record
+            type(self)._latest_scan = (time.monotonic(), scan_record)
+
+            # Route every progress event through the shared tracker as well as
+            # the caller's callback (SSE stream), if any.
+            progress = type(self).progress
+            progress.reset()
+            stream = on_progress
+
+            def on_progress(message, scanned, total, current_movie):
+                progress.update(message, scanned, total, current_movie)
+                if stream:
+                    stream(message, scanned, total, current_movie)
 
             logger.info(
                 "scan.started",
@@ -122,9 +210,10 @@ class ScanService:
                 if on_progress:
                     on_progress("Starting library scan...", 0, 0, None)
 
-                # Scan all movies with progress callback
-                scanned_movies = await self.scanner.scan_library(
-                    on_progress=on_progress
+                # Scan all movies with progress callback. Dedupe once here so
+                # both the database and collection phases see each movie once.
+                scanned_movies = _dedupe_by_rating_key(
+                    await self.scanner.scan_library(on_progress=on_progress)
                 )
 
                 logger.info("scan.movies_scanned", count=len(scanned_movies))
@@ -189,6 +278,8 @@ class ScanService:
 
             finally:
                 type(self)._current_scan = None
+                type(self)._latest_scan = (time.monotonic(), scan_record)
+                progress.reset()
                 await self.scanner.close()
 
     async def _update_database(
@@ -213,10 +304,7 @@ class ScanService:
         }
 
         # Deduplicate scanned movies by rating_key (keep last occurrence)
-        seen_keys: dict[str, dict] = {}
-        for m in scanned_movies:
-            seen_keys[m["rating_key"]] = m
-        scanned_movies = list(seen_keys.values())
+        scanned_movies = _dedupe_by_rating_key(scanned_movies)
 
         # Build set of scanned keys first
         scanned_rating_keys = {m["rating_key"] for m in scanned_movies}
@@ -235,6 +323,9 @@ class ScanService:
         else:
             existing_movies = {}
 
+        # One timestamp for the whole pass, shared by every row it touches
+        scanned_at = datetime.now()
+
         # Process scanned movies
         for movie_data in scanned_movies:
             rating_key = movie_data["rating_key"]
@@ -251,9 +342,9 @@ class ScanService:
                 # Update existing movie
                 movie = existing_movies[rating_key]
                 for key, value in movie_data.items():
-                    if key not in ("rating_key", "id", "created_at", "updated_at"):
+                    if key not in _PROTECTED_COLUMNS:
                         setattr(movie, key, value)
-                movie.last_scanned_at = datetime.now()
+                movie.last_scanned_at = scanned_at
                 # Set collection flags inline (avoids re-query in _update_collections)
                 movie.in_dv_collection = movie_data.get("dv_profile") is not None
                 movie.in_p7_collection = movie_data.get("dv_fel", False)
@@ -263,7 +354,7 @@ class ScanService:
             else:
                 # Add new movie (use merge to handle duplicate rating_keys)
                 movie = Movie(**movie_data)
-                movie.last_scanned_at = datetime.now()
+                movie.last_scanned_at = scanned_at
                 movie.in_dv_collection = movie_data.get("dv_profile") is not None
                 movie.in_p7_collection = movie_data.get("dv_fel", False)
                 movie.in_atmos_collection = movie_data.get("has_atmos", False)
@@ -276,11 +367,12 @@ class ScanService:
             await self.db.execute(
                 update(Movie)
                 .where(Movie.rating_key.in_(removed_rating_keys))
-                .values(last_scanned_at=datetime.now())
+                .values(last_scanned_at=scanned_at)
             )
             stats["removed"] = len(removed_rating_keys)
 
         await self.db.commit()
+        library_cache.invalidate()
 
         logger.info(
             "scan.database_updated",
@@ -338,6 +430,26 @@ class ScanService:
 
         return scans, total
 
+    async def get_latest_scan(self) -> ScanHistory | None:
+        """
+        Get the most recently started scan record
+
+        Single LIMIT 1 lookup for the status poll; skips the COUNT(*) that
+        get_scan_history runs for pagination. The row is reused for
+        LATEST_SCAN_TTL_SECONDS, and scans started here replace it as they
+        run, so most polls don't query at all.
+        """
+        cached = type(self)._latest_scan
+        if cached is not None and time.monotonic() - cached[0] < LATEST_SCAN_TTL_SECONDS:
+            return cached[1]
+
+        result = await self.db.execute(
+            select(ScanHistory).order_by(ScanHistory.started_at.desc()).limit(1)
+        )
+        scan = result.scalar_one_or_none()
+        type(self)._latest_scan = (time.monotonic(), scan)
+        return scan
+
     async def get_scan_by_id(self, scan_id: int) -> ScanHistory | None:
         """
         Get a specific scan record
@@ -6,7 +6,6 @@ import asyncio
 from datetime import datetime
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
 from app.core.config import get_settings
@@ -15,6 +14,14 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Quiet period the notification worker waits for after an enqueue, and the
+# most it will wait while enqueues keep arriving
+NOTIFICATION_SETTLE_SECONDS = 0.5
+NOTIFICATION_SETTLE_MAX_SECONDS = 5.0
+# Longest the worker sleeps without a signal; catches notifications queued by
+# other worker processes, whose enqueue signal never reaches this one
+NOTIFICATION_POLL_SECONDS = 60.0
+
 
 class TaskScheduler:
     """
@@ -23,9 +30,10 @@ class TaskScheduler:
     Manages all scheduled jobs:
     - Connection health checks (15 min intervals)
     - Periodic library scans (configurable)
-    - Monitor cycle (1 min when active)
-    - Notification queue processing (1 min)
+    - Monitor cycle (paused until monitoring is enabled)
+    - Notification queue processing (on enqueue, 1 min fallback)
     - Cleanup expired downloads (hourly)
+    - Prune exported reports over MAX_REPORTS_SIZE_MB (hourly)
     """
 
     def __init__(self):
@@ -33,6 +41,16 @@ class TaskScheduler:
         self.settings = get_settings()
         self.scheduler = AsyncIOScheduler(timezone="UTC")
         self._is_monitoring = False
+        self._notification_task: asyncio.Task | None = None
+
+        # Long-lived clients reused across runs so health checks and
+        # notifications keep their HTTP connections alive between ticks
+        self._qbit_client = None
+        self._radarr_client = None
+        self._telegram_handler = None
+        # Serializes first-use init so concurrent callers (startup, health
+        # checks, the notification worker) don't each build a handler
+        self._telegram_lock = asyncio.Lock()
 
     async def start(self):
         """Start the scheduler and add all jobs"""
@@ -45,6 +63,10 @@ class TaskScheduler:
         self.scheduler.start()
         logger.info("scheduler.started")
 
+        # Notification worker sleeps until something is queued
+        if self.settings.TELEGRAM_ENABLED:
+            self._notification_task = asyncio.create_task(self._notification_worker())
+
         # Auto-start based on configuration
         if self.settings.AUTO_START_MODE == "scan":
             logger.info("scheduler.auto_start_scan")
@@ -52,14 +74,47 @@ class TaskScheduler:
             await self._trigger_scan()
         elif self.settings.AUTO_START_MODE == "monitor":
             logger.info("scheduler.auto_start_monitor")
-            self._is_monitoring = True
+            self.enable_monitoring()
 
     async def shutdown(self):
         """Shutdown the scheduler gracefully"""
         logger.info("scheduler.shutting_down")
+        if self._notification_task:
+            # Let the worker unwind (and release its session) before the
+            # Telegram handler it may be sending through is shut down
+            self._notification_task.cancel()
+            try:
+                await self._notification_task
+            except asyncio.CancelledError:
+                pass
         self.scheduler.shutdown(wait=True)
+        await self._close_clients()
         logger.info("scheduler.shutdown_complete")
 
+    async def get_telegram_handler(self):
+        """Get the shared Telegram handler, initializing it on first use"""
+        if self._telegram_handler is not None:
+            return self._telegram_handler
+
+        async with self._telegram_lock:
+            if self._telegram_handler is None:
+                from app.integrations.telegram.handler import TelegramHandler
+
+                handler = TelegramHandler()
+                if not await handler.initialize():
+                    return handler
+                self._telegram_handler = handler
+        return self._telegram_handler
+
+    async def _close_clients(self):
+        """Close long-lived service clients"""
+        if self._qbit_client:
+            await self._qbit_client.close()
+        if self._radarr_client:
+            await self._radarr_client.close()
+        if self._telegram_handler:
+            await self._telegram_handler.shutdown()
+
     async def _add_jobs(self):
         """Add all scheduled jobs"""
         # Connection health checks (every 15 minutes)
@@ -83,7 +138,8 @@ class TaskScheduler:
                 replace_existing=True,
             )
 
-        # Monitor cycle (every 1 minute when enabled)
+        # Monitor cycle, added paused so the scheduler has nothing to wake
+        # for until monitoring is enabled
         self.scheduler.add_job(
             self._monitor_cycle,
             trigger=IntervalTrigger(
@@ -92,18 +148,9 @@ class TaskScheduler:
             id="monitor_cycle",
             name="Monitor Cycle",
             replace_existing=True,
+            next_run_time=None,
         )
 
-        # Process notification queue (every minute)
-        if self.settings.TELEGRAM_ENABLED:
-            self.scheduler.add_job(
-                self._process_notifications,
-                trigger=IntervalTrigger(minutes=1),
-                id="process_notifications",
-                name="Process Notification Queue",
-                replace_existing=True,
-            )
-
         # Cleanup expired downloads (hourly)
         self.scheduler.add_job(
             self._cleanup_expired_downloads,
@@ -113,6 +160,15 @@ class TaskScheduler:
             replace_existing=True,
         )
 
+        # Keep exported reports under the configured size cap (hourly)
+        self.scheduler.add_job(
+            self._cleanup_reports,
+            trigger=IntervalTrigger(hours=1),
+            id="cleanup_reports",
+            name="Cleanup Exported Reports",
+            replace_existing=True,
+        )
+
         logger.info("scheduler.jobs_added", job_count=len(self.scheduler.get_jobs()))
 
     async def _check_connections(self):
@@ -123,65 +179,59 @@ class TaskScheduler:
             from app.integrations.plex.client import PlexClient
             from app.integrations.qbittorrent.client import QBittorrentClient
             from app.integrations.radarr.client import RadarrClient
-            from app.integrations.telegram.handler import TelegramHandler
 
-            session_factory = get_session_factory()
+            async def plex_probe():
+                connected = await PlexClient().ping()
+                return connected, "Connected" if connected else "Failed to connect"
 
-            async with session_factory() as db:
-                from app.models.connection_status import ConnectionStatus
-                from sqlalchemy import select
-
-                # Check Plex
-                plex_client = PlexClient()
-                plex_connected = await plex_client.connect()
-
-                await self._update_connection_status(
-                    db,
-                    "plex",
-                    plex_connected,
-                    "Connected" if plex_connected else "Failed to connect",
-                )
+            async def health_probe(check):
+                health = await check
+                return health["is_connected"], health.get("error", "Connected")
 
-                # Check qBittorrent
-                if self.settings.QBITTORRENT_HOST:
-                    qbit_client = QBittorrentClient()
-                    qbit_health = await qbit_client.health_check()
+            # Probe every configured service concurrently; one slow service no
+            # longer delays the others.
+            probes = {"plex": plex_probe()}
 
-                    await self._update_connection_status(
-                        db,
-                        "qbittorrent",
-                        qbit_health["is_connected"],
-                        qbit_health.get("error", "Connected"),
-                    )
-                    await qbit_client.close()
+            if self.settings.QBITTORRENT_HOST:
+                if self._qbit_client is None:
+                    self._qbit_client = QBittorrentClient()
+                probes["qbittorrent"] = health_probe(self._qbit_client.health_check())
 
-                # Check Radarr
-                if self.settings.RADARR_URL:
-                    radarr_client = RadarrClient()
-                    radarr_health = await radarr_client.health_check()
+            if self.settings.RADARR_URL:
+                if self._radarr_client is None:
+                    self._radarr_client = RadarrClient()
+                probes["radarr"] = health_probe(self._radarr_client.health_check())
 
-                    await self._update_connection_status(
-                        db,
-                        "radarr",
-                        radarr_health["is_connected"],
-                        radarr_health.get("error", "Connected"),
-                    )
-                    await radarr_client.close()
+            if self.settings.TELEGRAM_ENABLED:
+                telegram_handler = await self.get_telegram_handler()
+                probes["telegram"] = health_probe(telegram_handler.health_check())
 
-                # Check Telegram
-                if self.settings.TELEGRAM_ENABLED:
-                    telegram_handler = TelegramHandler()
-                    telegram_health = await telegram_handler.health_check()
+            results = await asyncio.gather(*probes.values(), return_exceptions=True)
+
+            session_factory = get_session_factory()
+
+            async with session_factory() as db:
+                for service, result in zip(probes, results):
+                    if isinstance(result, Exception):
+                        logger.error(
+                            "scheduler.connection_probe_failed",
+                            service=service,
+                            error=str(result),
+                        )
+                        is_connected, message = False, str(result)
+                    else:
+                        is_connected, message = result
 
                     await self._update_connection_status(
-                        db,
-                        "telegram",
-                        telegram_health["is_connected"],
-                        telegram_health.get("error", "Connected"),
+                        db, service, is_connected, message
                     )
 
                 await db.commit()
 
+            from app.api.v1.connections import invalidate_status_snapshot
+
+            invalidate_status_snapshot()
+
         except Exception as e:
             logger.error("scheduler.check_connections_failed", error=str(e))
 
@@ -263,8 +313,38 @@ class TaskScheduler:
         # - Run upgrade detection
         # - Queue notifications
 
-    async def _process_notifications(self):
-        """Process notification queue"""
+    async def _notification_worker(self):
+        """Process the notification queue whenever it is signalled"""
+        from app.integrations.telegram.notifier import wait_for_pending_notifications
+
+        loop = asyncio.get_running_loop()
+        timeout = NOTIFICATION_POLL_SECONDS
+
+        while True:
+            # Wake immediately on enqueue; the timeout is cut short to the
+            # moment the next delayed notification falls due.
+            if await wait_for_pending_notifications(timeout=timeout):
+                # Let a burst of enqueues go quiet (bounded at a few seconds)
+                # so it is drained in one pass and packed into as few
+                # Telegram messages as possible.
+                settle_until = loop.time() + NOTIFICATION_SETTLE_MAX_SECONDS
+                while loop.time() < settle_until and await wait_for_pending_notifications(
+                    timeout=NOTIFICATION_SETTLE_SECONDS
+                ):
+                    pass
+            next_due = await self._process_notifications()
+            timeout = NOTIFICATION_POLL_SECONDS
+            if next_due is not None:
+                # Floored so rows another process is still sending can't spin
+                timeout = min(max(next_due, NOTIFICATION_SETTLE_SECONDS), timeout)
+
+    async def _process_notifications(self) -> float | None:
+        """
+        Process notification queue
+
+        Returns:
+            float | None: Seconds until the next pending notification is due
+        """
         logger.debug("scheduler.task.process_notifications")
 
         try:
@@ -273,14 +353,17 @@ class TaskScheduler:
             session_factory = get_session_factory()
 
             async with session_factory() as db:
-                notifier = TelegramNotifier(db)
+                notifier = TelegramNotifier(db, handler=await self.get_telegram_handler())
                 sent_count = await notifier.process_pending_notifications()
 
                 if sent_count > 0:
                     logger.info("scheduler.notifications_sent", count=sent_count)
 
+                return await notifier.seconds_until_next_due()
+
         except Exception as e:
             logger.error("scheduler.process_notifications_failed", error=str(e))
+            return None
 
     async def _cleanup_expired_downloads(self):
         """Cleanup expired download requests"""
@@ -289,7 +372,7 @@ class TaskScheduler:
         try:
             from app.models.download_history import DownloadHistory
             from app.models.pending_download import PendingDownload
-            from sqlalchemy import update
+            from sqlalchemy import select
 
             session_factory = get_session_factory()
 
@@ -327,14 +410,37 @@ class TaskScheduler:
         except Exception as e:
             logger.error("scheduler.cleanup_downloads_failed", error=str(e))
 
+    async def _cleanup_reports(self):
+        """Delete the oldest exported reports once over the size cap"""
+        logger.debug("scheduler.task.cleanup_reports")
+
+        try:
+            from app.utils.storage import prune_reports
+
+            stats = await asyncio.to_thread(
+                prune_reports,
+                self.settings.EXPORTS_DIR,
+                self.settings.MAX_REPORTS_SIZE_MB,
+            )
+
+            if stats["removed"]:
+                logger.info("scheduler.reports_pruned", **stats)
+
+        except Exception as e:
+            logger.error("scheduler.cleanup_reports_failed", error=str(e))
+
     def enable_monitoring(self):
-        """Enable monitor mode"""
+        """Enable monitor mode and resume the monitor cycle job"""
         self._is_monitoring = True
+        if self.scheduler.get_job("monitor_cycle"):
+            self.scheduler.resume_job("monitor_cycle")
         logger.info("scheduler.monitoring_enabled")
 
     def disable_monitoring(self):
-        """Disable monitor mode"""
+        """Disable monitor mode and pause the monitor cycle job"""
         self._is_monitoring = False
+        if self.scheduler.get_job("monitor_cycle"):
+            self.scheduler.pause_job("monitor_cycle")
         logger.info("scheduler.monitoring_disabled")
 
     def get_jobs(self) -> list[dict]:
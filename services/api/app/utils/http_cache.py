@@ -0,0 +1,35 @@
+"""
+HTTP Cache Utilities
+Weak ETags and conditional GET handling for JSON endpoints
+"""
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+
+# Browsers may keep the body but must revalidate before reusing it
+REVALIDATE = "private, max-age=0, must-revalidate"
+
+
+def weak_etag(body: bytes) -> str:
+    """Weak ETag over a serialized response body"""
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def conditional_json(request: Request, data: Any) -> Response:
+    """
+    Serialize data with a weak ETag, or answer 304 if the client's copy matches
+
+    Args:
+        request: Incoming request (If-None-Match is read from it)
+        data: JSON-serializable payload
+
+    Returns:
+        Response: 200 with the JSON body, or an empty 304
+    """
+    body = orjson.dumps(data)
+    headers = {"ETag": weak_etag(body), "Cache-Control": REVALIDATE}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
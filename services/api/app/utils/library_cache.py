@@ -0,0 +1,47 @@
+"""
+Library Cache
+Memoizes library-wide reads until the movies table next changes
+"""
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Writes made by other worker processes can't bump this process's version,
+# so entries also lapse after a short TTL.
+CACHE_TTL_SECONDS = 60
+
+_version = 0
+_entries: dict[Hashable, tuple[int, float, Any]] = {}
+
+
+def invalidate() -> None:
+    """Drop every cached read; call after committing changes to movies"""
+    global _version
+    _version += 1
+    _entries.clear()
+
+
+async def cached(key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+    """
+    Return the cached value for key, loading it on a miss
+
+    Args:
+        key: Cache key
+        load: Coroutine function producing the value
+
+    Returns:
+        The cached or freshly loaded value
+    """
+    now = time.monotonic()
+    entry = _entries.get(key)
+    if entry and entry[0] == _version and now - entry[1] < CACHE_TTL_SECONDS:
+        return entry[2]
+
+    version = _version
+    value = await load()
+    # Skip storing a value that a write raced past while it was loading
+    if version == _version:
+        _entries[key] = (version, now, value)
+    return value
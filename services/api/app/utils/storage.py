@@ -0,0 +1,61 @@
+"""
+Storage Utilities
+Size-capped housekeeping for report/export directories
+"""
+import heapq
+import os
+
+REPORT_EXTENSIONS = (".csv", ".json")
+
+
+def prune_reports(directory: str, max_size_mb: int) -> dict[str, int]:
+    """
+    Delete the oldest reports until the directory fits within max_size_mb
+
+    Walks the directory once with os.scandir so each file costs a single
+    cached stat() call, then pops the oldest entries off a heap only for as
+    long as the total is over the limit.
+
+    Args:
+        directory: Directory holding exported reports
+        max_size_mb: Size cap in megabytes
+
+    Returns:
+        dict: {"files": int, "total_bytes": int, "removed": int, "freed_bytes": int}
+    """
+    stats = {"files": 0, "total_bytes": 0, "removed": 0, "freed_bytes": 0}
+
+    try:
+        with os.scandir(directory) as entries:
+            reports = []
+            for entry in entries:
+                # Symlinks are skipped: removing one frees nothing, and
+                # following it would cost another stat()
+                if not entry.name.endswith(REPORT_EXTENSIONS):
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                st = entry.stat()
+                reports.append((st.st_mtime, st.st_size, entry.path))
+                stats["total_bytes"] += st.st_size
+    except FileNotFoundError:
+        return stats
+
+    stats["files"] = len(reports)
+    max_bytes = max_size_mb * 1024 * 1024
+    if stats["total_bytes"] <= max_bytes:
+        return stats
+
+    heapq.heapify(reports)
+    remaining = stats["total_bytes"]
+    while reports and remaining > max_bytes:
+        _, size, path = heapq.heappop(reports)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        remaining -= size
+        stats["removed"] += 1
+        stats["freed_bytes"] += size
+
+    return stats
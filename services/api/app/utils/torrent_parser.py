@@ -52,6 +52,30 @@ class TorrentTitleParser:
     # Languages (in brackets or specific keywords)
     LANGUAGE_PATTERN = re.compile(r'\[(.*?)\]|MULTI|DUAL', re.IGNORECASE)
 
+    # Clean-title cut points, tried in order when the title has no year
+    CLEAN_RESOLUTION_PATTERNS = tuple(
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            r'(\s+UHD\b)',  # Match UHD as whole word
+            r'(\s+4K\b)',    # Match 4K as whole word
+            r'(\s+2160p)',
+            r'(\s+1080p)',
+            r'(\s+720p)',
+        )
+    )
+    CLEAN_SOURCE_PATTERNS = tuple(
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            r'(\s+BluRay)',
+            r'(\s+Blu-ray)',
+            r'(\s+WEB-DL)',
+            r'(\s+WEBRip)',
+            r'(\s+REMUX)',
+        )
+    )
+    BRACKETS_PATTERN = re.compile(r'\[.*?\]')
+    TRAILING_DASH_PATTERN = re.compile(r'\s*-\s*$')
+
     @classmethod
     def parse(cls, title: str) -> dict[str, Any]:
         """
@@ -238,39 +262,25 @@ class TorrentTitleParser:
                 clean_title = title[:year_pos].strip()
         else:
             # Second try: Remove everything after resolution/UHD/4K markers
-            res_patterns = [
-                r'(\s+UHD\b)',  # Match UHD as whole word
-                r'(\s+4K\b)',    # Match 4K as whole word
-                r'(\s+2160p)',
-                r'(\s+1080p)',
-                r'(\s+720p)',
-            ]
-            for pattern in res_patterns:
-                match = re.search(pattern, title, re.IGNORECASE)
+            for pattern in cls.CLEAN_RESOLUTION_PATTERNS:
+                match = pattern.search(title)
                 if match:
                     clean_title = title[:match.start()].strip()
                     break
 
             # Third try: Remove everything after source markers if no resolution
             if clean_title == title:
-                source_patterns = [
-                    r'(\s+BluRay)',
-                    r'(\s+Blu-ray)',
-                    r'(\s+WEB-DL)',
-                    r'(\s+WEBRip)',
-                    r'(\s+REMUX)',
-                ]
-                for pattern in source_patterns:
-                    match = re.search(pattern, title, re.IGNORECASE)
+                for pattern in cls.CLEAN_SOURCE_PATTERNS:
+                    match = pattern.search(title)
                     if match:
                         clean_title = title[:match.start()].strip()
                         break
 
         # Remove language brackets from clean title
-        clean_title = re.sub(r'\[.*?\]', '', clean_title).strip()
+        clean_title = cls.BRACKETS_PATTERN.sub('', clean_title).strip()
 
         # Remove common prefixes/suffixes
-        clean_title = re.sub(r'\s*-\s*$', '', clean_title)
+        clean_title = cls.TRAILING_DASH_PATTERN.sub('', clean_title)
 
         metadata['clean_title'] = clean_title
 
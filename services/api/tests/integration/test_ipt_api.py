@@ -187,6 +187,21 @@ async def test_trigger_scan_error(client: AsyncClient):
         assert "Failed to trigger scan" in data["detail"]
 
 
+@pytest.mark.asyncio
+async def test_trigger_scan_background(client: AsyncClient):
+    """Test POST /api/v1/ipt/scan?background=true returns without waiting"""
+    scraper = MagicMock()
+    scraper.start_scan.return_value = True
+
+    with patch('app.api.v1.ipt.get_scraper', return_value=scraper):
+        response = await client.post("/api/v1/ipt/scan", params={"background": "true"})
+
+        assert response.status_code == 200
+        assert response.json() == {"success": True, "scanning": True, "started": True}
+        scraper.start_scan.assert_called_once()
+        scraper.scan.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_trigger_scan_timeout(client: AsyncClient):
     """Test POST /api/v1/ipt/scan with timeout"""
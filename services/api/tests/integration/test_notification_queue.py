@@ -0,0 +1,65 @@
+"""
+Integration tests for draining the Telegram notification queue
+"""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.integrations.telegram.notifier import (
+    MESSAGE_SEPARATOR,
+    NOTIFICATION_BATCH_SIZE,
+    TELEGRAM_MAX_MESSAGE_LENGTH,
+    TelegramNotifier,
+)
+from app.models.notification_queue import NotificationQueue
+
+
+class FakeHandler:
+    """Records every message instead of calling Telegram"""
+
+    def __init__(self):
+        self._application = object()
+        self.sent: list[str] = []
+
+    async def send_notification(self, message, parse_mode, disable_notification):
+        self.sent.append(message)
+        return len(self.sent)
+
+
+async def test_burst_larger_than_a_batch_is_packed_across_fetches(test_db: AsyncSession):
+    # Four of these fit one Telegram message; the burst spans three fetches
+    size = (TELEGRAM_MAX_MESSAGE_LENGTH - 3 * len(MESSAGE_SEPARATOR)) // 4
+    count = NOTIFICATION_BATCH_SIZE * 2 + 5
+    messages = [f"{i:04d}".ljust(size, ".") for i in range(count)]
+    due = datetime.now() - timedelta(minutes=1)
+    test_db.add_all(
+        NotificationQueue(
+            notification_type="scan_complete",
+            priority=5,
+            message=message,
+            parse_mode="HTML",
+            scheduled_at=due,
+        )
+        for message in messages
+    )
+    await test_db.commit()
+
+    handler = FakeHandler()
+    notifier = TelegramNotifier(test_db, handler=handler)
+    notifier.settings = SimpleNamespace(TELEGRAM_ENABLED=True)
+
+    sent = await notifier.process_pending_notifications()
+
+    assert sent == count
+    # Held-back partial messages are topped up, so packing is as tight as a
+    # single fetch of every row would give: ceil(25 / 4) messages
+    assert len(handler.sent) == -(-count // 4)
+    assert all(len(text) <= TELEGRAM_MAX_MESSAGE_LENGTH for text in handler.sent)
+    # Order is preserved across batches and messages
+    delivered = [m for text in handler.sent for m in text.split(MESSAGE_SEPARATOR)]
+    assert delivered == messages
+
+    statuses = (await test_db.execute(select(NotificationQueue.status))).scalars().all()
+    assert statuses and set(statuses) == {"sent"}
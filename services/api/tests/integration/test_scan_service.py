@@ -10,7 +10,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.movie import Movie
-from app.services.scan_service import ScanService
+from app.services.scan_service import ScanProgress, ScanService, _dedupe_by_rating_key
 
 
 @pytest_asyncio.fixture
@@ -226,3 +226,47 @@ async def test_update_collections_no_requery(scan_service, test_db):
     stats = await scan_service._update_collections(scanned)
     # Should return stats from collection manager (mocked)
     assert "added" in stats or "removed" in stats
+
+
+def test_dedupe_by_rating_key_keeps_last_occurrence():
+    """Repeated rating keys collapse to the last entry, first-seen order kept"""
+    scanned = [
+        {"rating_key": "100", "title": "Inception", "dv_profile": None},
+        {"rating_key": "200", "title": "The Matrix"},
+        {"rating_key": "100", "title": "Inception", "dv_profile": "P7"},
+    ]
+    deduped = _dedupe_by_rating_key(scanned)
+
+    assert [m["rating_key"] for m in deduped] == ["100", "200"]
+    assert deduped[0]["dv_profile"] == "P7"
+
+
+def test_scan_progress_publishes_on_percent_change():
+    """Snapshots only change when the integer percent or phase changes"""
+    progress = ScanProgress()
+    snapshots = []
+    for scanned in range(0, 1001):
+        progress.update(f"Scanned {scanned}", scanned, 1000, None)
+        if not snapshots or progress.snapshot is not snapshots[-1]:
+            snapshots.append(progress.snapshot)
+
+    assert len(snapshots) == 101
+    assert snapshots[-1]["progress"] == 100
+
+    progress.update("Updating database...", 0, 0, None)
+    assert progress.snapshot["message"] == "Updating database..."
+    assert progress.snapshot["progress"] == 0
+
+    progress.update("Updating Plex collections...", 0, 0, None)
+    assert progress.snapshot["message"] == "Updating Plex collections..."
+
+
+def test_scan_progress_signals_each_publish():
+    """Each publish sets the event waiters hold and arms a fresh one"""
+    progress = ScanProgress()
+    changed = progress.changed
+
+    progress.update("Found 10 movies to scan", 0, 10, None)
+
+    assert changed.is_set()
+    assert not progress.changed.is_set()
@@ -0,0 +1,32 @@
+"""
+Unit tests for the library read cache
+"""
+from app.utils import library_cache
+
+
+async def test_cached_reuses_value_until_invalidated():
+    calls = []
+
+    async def load():
+        calls.append(1)
+        return len(calls)
+
+    assert await library_cache.cached("stats", load) == 1
+    assert await library_cache.cached("stats", load) == 1
+
+    library_cache.invalidate()
+
+    assert await library_cache.cached("stats", load) == 2
+    assert len(calls) == 2
+
+
+async def test_write_during_load_is_not_cached():
+    async def load():
+        library_cache.invalidate()
+        return "stale"
+
+    async def fresh():
+        return "fresh"
+
+    assert await library_cache.cached("race", load) == "stale"
+    assert await library_cache.cached("race", fresh) == "fresh"
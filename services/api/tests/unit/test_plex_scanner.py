@@ -181,3 +181,23 @@ class TestQualityScore:
         version = {"dv_fel": False, "dv_profile": None, "resolution": None, "has_atmos": False}
         score = scanner._calculate_quality_score(version)
         assert score == 0
+
+
+# --- Movie Identity ---
+
+
+class TestScanMovieIdentity:
+    async def test_title_and_year_come_from_fresh_xml(self, scanner):
+        # A listing reused from an earlier snapshot still has the old match
+        stale = MagicMock(ratingKey=42, title="Old Title", year=1999, titleSort=None, originalTitle=None)
+        xml = {
+            "MediaContainer": {
+                "Video": {"@title": "New Title", "@year": "2001", "@titleSort": "New Title", "Media": []}
+            }
+        }
+        with patch.object(scanner, "fetch_movie_xml", return_value=xml):
+            data = await scanner.scan_movie(stale)
+
+        assert data["title"] == "New Title"
+        assert data["year"] == 2001
+        assert data["sort_title"] == "New Title"
@@ -0,0 +1,55 @@
+"""
+Unit tests for the scheduler's notification worker
+"""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.tasks.scheduler import (
+    NOTIFICATION_POLL_SECONDS,
+    NOTIFICATION_SETTLE_SECONDS,
+    TaskScheduler,
+)
+
+
+async def _run_worker(next_due: list[float | None]) -> list[float]:
+    """Run the worker for len(next_due) drains, returning each wait's timeout"""
+    timeouts: list[float] = []
+
+    async def fake_wait(timeout: float) -> bool:
+        timeouts.append(timeout)
+        if len(timeouts) > len(next_due):
+            raise asyncio.CancelledError
+        return False
+
+    scheduler = TaskScheduler()
+    with (
+        patch(
+            "app.integrations.telegram.notifier.wait_for_pending_notifications",
+            side_effect=fake_wait,
+        ),
+        patch.object(scheduler, "_process_notifications", AsyncMock(side_effect=next_due)),
+        pytest.raises(asyncio.CancelledError),
+    ):
+        await scheduler._notification_worker()
+
+    return timeouts
+
+
+async def test_worker_wakes_when_next_notification_is_due():
+    timeouts = await _run_worker([12.0])
+
+    assert timeouts == [NOTIFICATION_POLL_SECONDS, 12.0]
+
+
+async def test_worker_falls_back_to_poll_interval():
+    timeouts = await _run_worker([None, 3600.0])
+
+    assert timeouts == [NOTIFICATION_POLL_SECONDS] * 3
+
+
+async def test_worker_floors_overdue_wait():
+    timeouts = await _run_worker([0.0])
+
+    assert timeouts == [NOTIFICATION_POLL_SECONDS, NOTIFICATION_SETTLE_SECONDS]
@@ -0,0 +1,69 @@
+"""
+Unit tests for report storage pruning
+"""
+import os
+
+from app.utils.storage import prune_reports
+
+
+def _make_report(directory, name, size, mtime):
+    path = directory / name
+    path.write_bytes(b"x" * size)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+class TestPruneReports:
+    def test_missing_directory(self, tmp_path):
+        stats = prune_reports(str(tmp_path / "missing"), max_size_mb=10)
+        assert stats == {"files": 0, "total_bytes": 0, "removed": 0, "freed_bytes": 0}
+
+    def test_under_limit_keeps_everything(self, tmp_path):
+        _make_report(tmp_path, "a.json", 1024, 1000)
+        _make_report(tmp_path, "b.csv", 1024, 2000)
+
+        stats = prune_reports(str(tmp_path), max_size_mb=10)
+
+        assert stats["files"] == 2
+        assert stats["total_bytes"] == 2048
+        assert stats["removed"] == 0
+        assert len(list(tmp_path.iterdir())) == 2
+
+    def test_removes_oldest_first(self, tmp_path):
+        mb = 1024 * 1024
+        oldest = _make_report(tmp_path, "old.json", 6 * mb, 1000)
+        middle = _make_report(tmp_path, "mid.csv", 6 * mb, 2000)
+        newest = _make_report(tmp_path, "new.json", 6 * mb, 3000)
+
+        stats = prune_reports(str(tmp_path), max_size_mb=12)
+
+        assert stats["removed"] == 1
+        assert stats["freed_bytes"] == 6 * mb
+        assert not oldest.exists()
+        assert middle.exists()
+        assert newest.exists()
+
+    def test_ignores_other_files(self, tmp_path):
+        mb = 1024 * 1024
+        other = _make_report(tmp_path, "notes.txt", 20 * mb, 1000)
+        (tmp_path / "sub.json").mkdir()
+
+        stats = prune_reports(str(tmp_path), max_size_mb=10)
+
+        assert stats["files"] == 0
+        assert other.exists()
+
+    def test_ignores_symlinks(self, tmp_path):
+        mb = 1024 * 1024
+        target_dir = tmp_path / "elsewhere"
+        target_dir.mkdir()
+        target = _make_report(target_dir, "big.json", 20 * mb, 1000)
+        reports = tmp_path / "reports"
+        reports.mkdir()
+        (reports / "link.json").symlink_to(target)
+
+        stats = prune_reports(str(reports), max_size_mb=10)
+
+        assert stats["files"] == 0
+        assert stats["removed"] == 0
+        assert target.exists()
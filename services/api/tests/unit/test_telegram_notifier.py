@@ -0,0 +1,94 @@
+"""
+Unit tests for Telegram message splitting and queue timing
+"""
+import re
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from app.integrations.telegram.notifier import (
+    TELEGRAM_MAX_MESSAGE_LENGTH,
+    TelegramNotifier,
+    _open_tags,
+    _split_message,
+)
+
+
+def test_short_message_is_not_split():
+    assert _split_message("<b>Scan Complete</b>") == ["<b>Scan Complete</b>"]
+
+
+def test_long_message_splits_on_lines_within_limit():
+    lines = [f"• <b>Movie {i}</b> removed from All Dolby Vision" for i in range(300)]
+    parts = _split_message("\n".join(lines))
+
+    assert len(parts) > 1
+    assert all(len(part) <= TELEGRAM_MAX_MESSAGE_LENGTH for part in parts)
+    assert parts[1].startswith(f"<i>(continued 2/{len(parts)})</i>\n")
+
+    # Every line survives intact, in order
+    rejoined = [parts[0]] + [part.split("\n", 1)[1] for part in parts[1:]]
+    assert "\n".join(rejoined).split("\n") == lines
+
+
+def test_oversized_line_is_hard_wrapped():
+    parts = _split_message("x" * (TELEGRAM_MAX_MESSAGE_LENGTH * 2))
+
+    assert len(parts) == 3
+    assert all(len(part) <= TELEGRAM_MAX_MESSAGE_LENGTH for part in parts)
+
+
+def test_hard_wrap_never_cuts_inside_a_tag_or_entity():
+    line = "<b>Tom &amp; Jerry</b> " * 800
+    parts = _split_message(line)
+
+    assert len(parts) > 1
+    bodies = [parts[0]] + [part.split("\n", 1)[1] for part in parts[1:]]
+    # Tags may be closed and reopened at a cut; the text itself is unchanged
+    assert re.sub(r"<[^>]*>", "", "".join(bodies)) == re.sub(r"<[^>]*>", "", line)
+    for body in bodies:
+        assert body.rfind("<") < body.rfind(">")
+        assert body.rfind("&") < body.rfind(";")
+        assert _open_tags(body) == []
+        assert len(body) <= TELEGRAM_MAX_MESSAGE_LENGTH
+
+
+def test_hard_wrap_closes_and_reopens_tags_at_the_cut():
+    line = '<b>Removed: <a href="https://plex.tv/m">' + "x" * 9000 + "</a></b>"
+    parts = _split_message(line)
+
+    assert len(parts) == 3
+    bodies = [parts[0]] + [part.split("\n", 1)[1] for part in parts[1:]]
+    assert bodies[0].endswith("</a></b>")
+    assert bodies[1].startswith('<b><a href="https://plex.tv/m">')
+    assert bodies[1].endswith("</a></b>")
+    assert all(_open_tags(body) == [] for body in bodies)
+    assert all(len(part) <= TELEGRAM_MAX_MESSAGE_LENGTH for part in parts)
+    assert "".join(re.sub(r"<[^>]*>", "", body) for body in bodies) == "Removed: " + "x" * 9000
+
+
+def _notifier_with_next_due(next_at):
+    db = MagicMock()
+    db.scalar = AsyncMock(return_value=next_at)
+    notifier = TelegramNotifier(db, handler=MagicMock())
+    notifier.settings = SimpleNamespace(TELEGRAM_ENABLED=True)
+    return notifier
+
+
+async def test_seconds_until_next_due_with_aware_scheduled_at():
+    # asyncpg returns timestamptz columns as aware datetimes
+    next_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    seconds = await _notifier_with_next_due(next_at).seconds_until_next_due()
+
+    assert 25 < seconds <= 30
+
+
+async def test_seconds_until_next_due_is_zero_when_overdue():
+    next_at = datetime.now(timezone.utc) - timedelta(minutes=5)
+
+    assert await _notifier_with_next_due(next_at).seconds_until_next_due() == 0.0
+
+
+async def test_seconds_until_next_due_without_pending_rows():
+    assert await _notifier_with_next_due(None).seconds_until_next_due() is None
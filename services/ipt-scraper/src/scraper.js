@@ -26,6 +26,30 @@ async function ensureDataDir() {
   }
 }
 
+/**
+ * Write JSON to a file atomically
+ *
+ * Serializes once, writes a temp file in the same directory with a single
+ * write, fsyncs it, then renames it over the target so readers never see a
+ * partially written file.
+ */
+async function writeJsonAtomic(file, data) {
+  const tmp = `${file}.${process.pid}.${Date.now()}.tmp`;
+  const handle = await fs.open(tmp, 'w');
+  try {
+    await handle.writeFile(JSON.stringify(data, null, 2), 'utf8');
+    await handle.sync();
+  } finally {
+    await handle.close();
+  }
+  try {
+    await fs.rename(tmp, file);
+  } catch (error) {
+    await fs.unlink(tmp).catch(() => {});
+    throw error;
+  }
+}
+
 /**
  * Load known torrents from file
  */
@@ -44,11 +68,7 @@ async function loadKnownTorrents() {
  */
 async function saveKnownTorrents(torrents) {
   await ensureDataDir();
-  await fs.writeFile(
-    KNOWN_TORRENTS_FILE,
-    JSON.stringify(torrents, null, 2),
-    'utf8'
-  );
+  await writeJsonAtomic(KNOWN_TORRENTS_FILE, torrents);
 }
 
 /**
@@ -60,11 +80,7 @@ async function saveLatestResults(results) {
     timestamp: new Date().toISOString(),
     torrents: results,
   };
-  await fs.writeFile(
-    LATEST_RESULTS_FILE,
-    JSON.stringify(data, null, 2),
-    'utf8'
-  );
+  await writeJsonAtomic(LATEST_RESULTS_FILE, data);
 }
 
 /**